@@ -31,13 +31,48 @@
 
 from __future__ import annotations
 
+import sys
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from XPPython3 import xp
 from XPPython3.xp_typing import XPLMDataRef, XPLMDataRefInfo_t
 
+# Shape of a spec default, keyed by exact type (one dict probe for the usual
+# plain values); subclasses fall back to their first listed base class.
+_DEFAULT_KINDS: Dict[type, str] = {
+    list: "seq",
+    tuple: "seq",
+    bytes: "data",
+    bytearray: "data",
+    bool: "int",
+    int: "int",
+    float: "float",
+}
+
+
+def _default_kind(value: Any) -> Optional[str]:
+    kind = _DEFAULT_KINDS.get(type(value))
+    if kind is None:
+        kind = next((_DEFAULT_KINDS[b] for b in type(value).__mro__ if b in _DEFAULT_KINDS), None)
+    return kind
+
+
+# set_value() rules keyed by exact dtype:
+#   (xp setter name, accepted value types, expected label, coerce, is_array)
+# Array setters are called as setter(h, value, 0, len(value)); coerce=None
+# passes the value through unchanged.
+_SET_RULES: Dict[int, Tuple[str, Tuple[type, ...], str, Optional[Callable[[Any], Any]], bool]] = {
+    xp.Type_Float: ("setDataf", (int, float), "float", float, False),
+    xp.Type_Int: ("setDatai", (int, float), "int", int, False),
+    xp.Type_Double: ("setDatad", (int, float), "double", float, False),
+    xp.Type_FloatArray: ("setDatavf", (list, tuple), "list[float]", list, True),
+    xp.Type_IntArray: ("setDatavi", (list, tuple), "list[int]", list, True),
+    xp.Type_Data: ("setDatab", (bytes, bytearray), "bytes/bytearray", None, True),
+}
+
 
 @dataclass(slots=True)
 class DataRefSpec:
@@ -58,12 +93,19 @@ class DataRefSpec:
     handle: Optional[XPLMDataRef] = None
     is_dummy: bool = True
 
+    # get_value()/set_value() accessors specialized to (handle, type); bound
+    # lazily by the manager and dropped whenever the handle or type changes.
+    reader: Optional[Callable[[], Any]] = field(default=None, repr=False, compare=False)
+    writer: Optional[Callable[[Any], None]] = field(default=None, repr=False, compare=False)
+
     @staticmethod
+    @lru_cache(maxsize=64)
     def _mask_to_dtype(mask: int) -> int:
         """
         XPLM reports a *bitmask* of supported types.
         Choose one canonical dtype for manager get/set dispatch.
         Preference: arrays first, then scalars (double > float > int).
+        Pure in the mask, so results are cached across specs.
         """
         m = int(mask) if mask is not None else 0
 
@@ -117,16 +159,17 @@ class DataRefSpec:
             default = [0.0]
             dtype = xp.Type_FloatArray
         else:
-            if isinstance(default, (list, tuple)):
+            kind = _default_kind(default)
+            if kind == "seq":
                 if default and all(isinstance(x, int) for x in default):
                     dtype = xp.Type_IntArray
                 else:
                     dtype = xp.Type_FloatArray
-            elif isinstance(default, (bytes, bytearray)):
+            elif kind == "data":
                 dtype = xp.Type_Data
-            elif isinstance(default, int):
+            elif kind == "int":
                 dtype = xp.Type_Int
-            elif isinstance(default, float):
+            elif kind == "float":
                 dtype = xp.Type_Float
             else:
                 default = [0.0]
@@ -165,16 +208,19 @@ class DataRefSpec:
         self.handle = handle
         self.is_dummy = False
         self.type = dtype
+        self.reader = None
+        self.writer = None
         self.writable = bool(getattr(info, "writable", False))
 
         # Normalize default for convenience
+        kind = _default_kind(self.default)
         if dtype in (xp.Type_FloatArray, xp.Type_IntArray, xp.Type_Data):
-            if not isinstance(self.default, (list, tuple, bytes, bytearray)):
+            if kind != "seq" and kind != "data":
                 self.default = [
-                    float(self.default) if isinstance(self.default, (int, float)) else 0.0
+                    float(self.default) if kind == "int" or kind == "float" else 0.0
                 ]
         else:
-            if isinstance(self.default, (list, tuple, bytes, bytearray)):
+            if kind == "seq" or kind == "data":
                 self.default = 0.0
 
 
@@ -197,38 +243,58 @@ class DataRefManager:
         self._ready: bool = False
         self._timed_out: bool = False
 
+        # Handles found by ready() but not yet promoted (info missing or
+        # promote failed); X-Plane handles are stable, so retries skip findDataRef.
+        self._found: Dict[str, XPLMDataRef] = {}
+
         if datarefs:
             for path, cfg in datarefs.items():
+                # Interned keys let lookups with the same literal path hit on identity
+                path = sys.intern(path)
                 required = bool(cfg.get("required", False))
                 default = cfg.get("default", None)
 
-                if path not in self.specs:
+                spec = self.specs.get(path)
+                if spec is None:
                     self.specs[path] = DataRefSpec.dummy(path, required=required, default=default)
                     self._ready = False
                 else:
-                    spec = self.specs[path]
                     if "required" in cfg:
                         spec.required = required
                     if "default" in cfg:
                         spec.default = default
 
     def add_spec(self, path: str, spec: DataRefSpec) -> None:
-        self.specs[path] = spec
+        self.specs[sys.intern(path)] = spec
         self._ready = False
 
     def require_spec(self, path: str) -> DataRefSpec:
-        if path not in self.specs:
+        spec = self.specs.get(path)
+        if spec is None:
             raise KeyError("Invalid spec path '%s'" % path)
-        return self.specs[path]
+        return spec
 
     def get_value(self, path: str) -> Any:
         spec = self.require_spec(path)
 
+        reader = spec.reader
+        if reader is not None:
+            return reader()
+
         if spec.handle is None:
             if spec.required:
                 raise RuntimeError(f"DataRef '{path}' not ready; call ready() first")
             return spec.default
 
+        reader = spec.reader = self._bind_reader(spec)
+        return reader()
+
+    def _bind_reader(self, spec: DataRefSpec) -> Callable[[], Any]:
+        """
+        Resolve the xp getter for a promoted spec once. The handle and type
+        are fixed until the next promote()/clear(), so later reads skip the
+        type-mask dispatch.
+        """
         xp_mod = self.xp
         h = spec.handle
         t = spec.type
@@ -237,91 +303,98 @@ class DataRefManager:
         # Scalar types
         # -------------------------
         if t & xp_mod.Type_Float:
-            return xp_mod.getDataf(h)
+            return partial(xp_mod.getDataf, h)
 
         if t & xp_mod.Type_Int:
-            return xp_mod.getDatai(h)
+            return partial(xp_mod.getDatai, h)
 
         if t & xp_mod.Type_Double:
-            return xp_mod.getDatad(h)
+            return partial(xp_mod.getDatad, h)
 
         # -------------------------
         # Float array
         # -------------------------
         if t & xp_mod.Type_FloatArray:
-            size = xp_mod.getDatavf(h, None, 0, -1)
-            out = [0.0] * size
-            xp_mod.getDatavf(h, out, 0, size)
-            return out
+            get_vf = xp_mod.getDatavf
+
+            def read_float_array() -> list:
+                size = get_vf(h, None, 0, -1)
+                out = [0.0] * size
+                get_vf(h, out, 0, size)
+                return out
+
+            return read_float_array
 
         # -------------------------
         # Int array
         # -------------------------
         if t & xp_mod.Type_IntArray:
-            size = xp_mod.getDatavi(h, None, 0, -1)
-            out = [0] * size
-            xp_mod.getDatavi(h, out, 0, size)
-            return out
+            get_vi = xp_mod.getDatavi
+
+            def read_int_array() -> list:
+                size = get_vi(h, None, 0, -1)
+                out = [0] * size
+                get_vi(h, out, 0, size)
+                return out
+
+            return read_int_array
 
         # -------------------------
         # Byte array (Type_Data)
         # -------------------------
         if t & xp_mod.Type_Data:
-            size = xp_mod.getDatab(h, None, 0, -1)
-            out = bytearray(size)
-            xp_mod.getDatab(h, out, 0, size)
-            return out
+            get_b = xp_mod.getDatab
 
-        raise TypeError(f"Unsupported dtype mask {t} for '{path}'")
+            def read_bytes() -> bytearray:
+                size = get_b(h, None, 0, -1)
+                out = bytearray(size)
+                get_b(h, out, 0, size)
+                return out
+
+            return read_bytes
+
+        raise TypeError(f"Unsupported dtype mask {t} for '{spec.name}'")
 
     def set_value(self, path: str, value: Any) -> None:
         spec = self.require_spec(path)
 
-        if spec.handle is None:
-            spec.default = value
-            return
+        writer = spec.writer
+        if writer is None:
+            if spec.handle is None:
+                spec.default = value
+                return
+            writer = spec.writer = self._bind_writer(spec)
 
-        xp_mod = self.xp
-        h = spec.handle
+        writer(value)
+
+    def _bind_writer(self, spec: DataRefSpec) -> Callable[[Any], None]:
+        """
+        Resolve the _SET_RULES entry and xp setter for a promoted spec once;
+        the returned writer only validates and coerces the value.
+        """
+        path = spec.name
         t = spec.type
+        rule = _SET_RULES.get(t)
+        if rule is None:
+            raise TypeError(f"Unsupported dtype {t} for '{path}'")
+
+        setter_name, accepted, expected, coerce, is_array = rule
+        setter = getattr(self.xp, setter_name)
+        h = spec.handle
 
-        if t == xp.Type_Float:
-            if not isinstance(value, (int, float)):
-                raise TypeError(f"Expected float for '{path}'")
-            xp_mod.setDataf(h, float(value))
-            return
-
-        if t == xp.Type_Int:
-            if not isinstance(value, (int, float)):
-                raise TypeError(f"Expected int for '{path}'")
-            xp_mod.setDatai(h, int(value))
-            return
-
-        if t == xp.Type_Double:
-            if not isinstance(value, (int, float)):
-                raise TypeError(f"Expected double for '{path}'")
-            xp_mod.setDatad(h, float(value))
-            return
-
-        if t == xp.Type_FloatArray:
-            if not isinstance(value, (list, tuple)):
-                raise TypeError(f"Expected list[float] for '{path}'")
-            xp_mod.setDatavf(h, list(value), 0, len(value))
-            return
-
-        if t == xp.Type_IntArray:
-            if not isinstance(value, (list, tuple)):
-                raise TypeError(f"Expected list[int] for '{path}'")
-            xp_mod.setDatavi(h, list(value), 0, len(value))
-            return
-
-        if t == xp.Type_Data:
-            if not isinstance(value, (bytes, bytearray)):
-                raise TypeError(f"Expected bytes/bytearray for '{path}'")
-            xp_mod.setDatab(h, value, 0, len(value))
-            return
-
-        raise TypeError(f"Unsupported dtype {t} for '{path}'")
+        def write(value: Any) -> None:
+            if not isinstance(value, accepted):
+                raise TypeError(f"Expected {expected} for '{path}'")
+
+            if coerce is not None:
+                value = coerce(value)
+
+            if is_array:
+                setter(h, value, 0, len(value))
+            else:
+                setter(h, value)
+
+        return write
 
     def all_paths(self) -> list[str]:
         return list(self.specs.keys())
@@ -333,12 +406,16 @@ class DataRefManager:
         for _, spec in list(self.specs.items()):
             spec.is_dummy = True
             spec.handle = None
+            spec.reader = None
+            spec.writer = None
+        self._found.clear()
         self._start_time = None
         self._ready = False
         self._timed_out = False
 
     def close(self) -> None:
         self.specs.clear()
+        self._found.clear()
         self._start_time = None
         self._ready = False
         self._timed_out = False
@@ -361,11 +438,14 @@ class DataRefManager:
             if spec.handle:
                 continue
 
-            handle = self.xp.findDataRef(path)
+            handle = self._found.get(path)
             if handle is None:
-                if spec.required:
-                    required_all_real = False
-                continue
+                handle = self.xp.findDataRef(path)
+                if handle is None:
+                    if spec.required:
+                        required_all_real = False
+                    continue
+                self._found[path] = handle
 
             info = self.xp.getDataRefInfo(handle)
             if info is None:
@@ -375,6 +455,7 @@ class DataRefManager:
 
             try:
                 spec.promote(handle, info)
+                del self._found[path]
             except Exception as exc:
                 self.xp.log(f"[DRM] WARN: failed to promote {path}: {exc!r}")
                 if spec.required:
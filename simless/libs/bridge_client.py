@@ -36,6 +36,7 @@ from __future__ import annotations
 import errno
 import os
 import socket
+import sys
 import time
 from dataclasses import dataclass
 from enum import Enum
@@ -388,10 +389,12 @@ class XPBridgeClient:
         # --------------------------------------------------------------
         # 6. Maintain idx → path mapping
         # --------------------------------------------------------------
+        # Paths are interned like DataRefManager's handle keys, so every
+        # event's handles.get(path) matches on identity, not a string compare.
         for m in msgs:
             if m.type == BridgeMsgType.META:
                 v = m.value
-                self._idx_to_path[v.idx] = v.name
+                self._idx_to_path[v.idx] = sys.intern(v.name)
 
         # --------------------------------------------------------------
         # 7. Respond to PING (raise if send fails)
@@ -412,13 +415,18 @@ class XPBridgeClient:
         wire_msgs = self.poll_wire()
         out: List[BridgeData] = []
 
+        # UPDATE batches can carry many entries per poll; bind the per-entry
+        # lookups once instead of re-resolving them for every entry.
+        path_for_idx = self._idx_to_path.get
+        append = out.append
+
         for m in wire_msgs:
             t = m.type
             v = m.value
 
             if t == BridgeMsgType.META:
-                path = self._idx_to_path.get(v.idx)
-                out.append(
+                path = path_for_idx(v.idx)
+                append(
                     BridgeData(
                         type=BridgeDataType.META,
                         path=path,
@@ -432,11 +440,10 @@ class XPBridgeClient:
 
             elif t == BridgeMsgType.UPDATE:
                 for entry in v.entries:
-                    path = self._idx_to_path.get(entry.idx)
-                    out.append(
+                    append(
                         BridgeData(
                             type=BridgeDataType.UPDATE,
-                            path=path,
+                            path=path_for_idx(entry.idx),
                             dtype=None,
                             writable=None,
                             array_size=None,
@@ -446,7 +453,7 @@ class XPBridgeClient:
                     )
 
             elif t == BridgeMsgType.ERROR:
-                out.append(
+                append(
                     BridgeData(
                         type=BridgeDataType.ERROR,
                         path=None,
@@ -516,29 +523,34 @@ class XPBridgeClient:
             self._session_initialized = True
             self.set_conn_status(f"Bridge sync active")
 
-        for ev in events:
-            if not ev.path:
-                continue
-            if ev.type is BridgeDataType.META:
-                ref = self.fake_xp.dataref_manager.get_handle(ev.path)
-                if not ref or not ev.dtype:
-                    continue
-                if not ref.dummy and not ref.cached:
-                    continue
+        dm = self.fake_xp.dataref_manager
+        get_handle = dm.get_handle
 
-                # Promote authoritative type
-                self.fake_xp.dataref_manager.promote(
-                    ref=ref,
-                    dtype=ev.dtype,
-                    writable=bool(ev.writable),
-                    array_size=ev.array_size or 1,
-                )
+        # One change stamp for the whole poll instead of one per dataref
+        with dm.batch_updates():
+            for ev in events:
+                if not ev.path:
+                    continue
+                if ev.type is BridgeDataType.META:
+                    ref = get_handle(ev.path)
+                    if not ref or not ev.dtype:
+                        continue
+                    if not ref.dummy and not ref.cached:
+                        continue
+
+                    # Promote authoritative type
+                    dm.promote(
+                        ref=ref,
+                        dtype=ev.dtype,
+                        writable=bool(ev.writable),
+                        array_size=ev.array_size or 1,
+                    )
 
-            elif ev.type is BridgeDataType.UPDATE:
-                ref = self.fake_xp.dataref_manager.get_handle(ev.path)
-                assert ref is not None, f"Unknown handle: {ev.path}"
+                elif ev.type is BridgeDataType.UPDATE:
+                    ref = get_handle(ev.path)
+                    assert ref is not None, f"Unknown handle: {ev.path}"
 
-                self.fake_xp.dataref_manager.update_value(ref.df_id, ref.type, value=ev.value)
+                    dm.update_value(ref.df_id, ref.type, value=ev.value)
 
-            elif ev.type is BridgeDataType.ERROR:
-                self.fake_xp.log(f"[Bridge] ERROR: {ev.text}")
+                elif ev.type is BridgeDataType.ERROR:
+                    self.fake_xp.log(f"[Bridge] ERROR: {ev.text}")
@@ -13,7 +13,9 @@
 #   • setters can reshape dummy datarefs as they are formed with a default.
 #   • In-place promotion: promote_handle flips is_dummy -> False and updates
 #     metadata on the same object.
-#   • Single global lock: one RLock protects _handles and all handle state.
+#   • Single global lock: one RLock serializes handle creation, deletion and
+#     metadata changes. Lookups and value get/set on existing handles are
+#     lock-free (GIL-atomic dict/list/attribute operations).
 #   • Subsystem-composed: FakeXP binds only declared public API names.
 #
 # ARRAY SEMANTICS
@@ -24,63 +26,201 @@
 
 from __future__ import annotations
 
+import sys
 import threading
 import time
+from contextlib import contextmanager
+from functools import lru_cache
 from threading import RLock
-from typing import Any, Dict, Optional, Sequence, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
+from simless.libs.fake_xp_constants import (
+    Type_Data, Type_Double, Type_Float, Type_FloatArray, Type_Int, Type_IntArray,
+)
 from simless.libs.fake_xp_types import FakeDataRef, ReadArray, ReadScalar, WriteArray, WriteScalar
 from xp_typing import XPLMDataRef, XPLMDataTypeID
 
 if TYPE_CHECKING:
     from simless.libs.fake_xp import FakeXP
 
+_SCALAR_TYPES = frozenset((Type_Float, Type_Int, Type_Double))
+_ARRAY_TYPES = frozenset((Type_IntArray, Type_FloatArray, Type_Data))
+_SCALAR_CASTS = {Type_Float: float, Type_Int: int, Type_Double: float}
+_ARRAY_CASTS = {Type_FloatArray: float, Type_IntArray: int}
+
+# Empty find_handle() memo. The key is a private object so no caller-supplied
+# name (including None) can match it.
+_NO_FIND: Tuple[object, Optional[FakeDataRef]] = (object(), None)
+
+# default_value_for() storage by exact single dtype; combined masks fall back
+# to the bit tests, whose priority order these entries agree with.
+_DEFAULT_FACTORIES: Dict[int, Callable[[int], Any]] = {
+    Type_FloatArray: lambda n: [0.0] * n,
+    Type_IntArray: lambda n: [0] * n,
+    Type_Data: bytearray,
+    Type_Float: lambda n: 0.0,
+    Type_Double: lambda n: 0.0,
+    Type_Int: lambda n: 0,
+}
+
+
+def _element_default(dtype: int) -> float | int:
+    """Scalar fill value for dtype: the element DataRefManager.default_value_for() uses."""
+    if dtype & Type_FloatArray:
+        return 0.0
+    if dtype & (Type_IntArray | Type_Data):
+        return 0
+    if dtype & (Type_Float | Type_Double):
+        return 0.0
+    if dtype & Type_Int:
+        return 0
+    return 0.0
+
+
+@lru_cache(maxsize=None)
+def _is_compatible(ref_type: int, desired_type: int) -> bool:
+    """
+    Whether a ref promoted as ``ref_type`` may be read as ``desired_type``.
+
+    Pure function of two small bitmasks, so results are memoized; every read
+    of a promoted dataref goes through here.
+    """
+    # ------------------------------------------------------------
+    # 1. Direct bitmask compatibility
+    # ------------------------------------------------------------
+    if (ref_type & desired_type) != 0:
+        return True
+
+    # ------------------------------------------------------------
+    # 2. Array → scalar (FloatArray→Float, IntArray→Int)
+    # ------------------------------------------------------------
+    if (ref_type & Type_FloatArray) and (desired_type & Type_Float):
+        return True
+    if (ref_type & Type_IntArray) and (desired_type & Type_Int):
+        return True
+
+    # ------------------------------------------------------------
+    # 3. Array → scalar (cross‑type)
+    #    FloatArray → Int
+    #    IntArray   → Float
+    # ------------------------------------------------------------
+    if (ref_type & Type_FloatArray) and (desired_type & Type_Int):
+        return True
+    if (ref_type & Type_IntArray) and (desired_type & Type_Float):
+        return True
+
+    # ------------------------------------------------------------
+    # 4. Scalar → array (Float→FloatArray, Int→IntArray)
+    # ------------------------------------------------------------
+    if (ref_type & Type_Float) and (desired_type & Type_FloatArray):
+        return True
+    if (ref_type & Type_Int) and (desired_type & Type_IntArray):
+        return True
+
+    # ------------------------------------------------------------
+    # 5. Scalar → array (cross‑type)
+    #    Float → IntArray
+    #    Int   → FloatArray
+    # ------------------------------------------------------------
+    if (ref_type & Type_Float) and (desired_type & Type_IntArray):
+        return True
+    if (ref_type & Type_Int) and (desired_type & Type_FloatArray):
+        return True
+
+    return False
+
 
 class DataRefManager:
     """
     FakeXP DataRef backend subsystem using a single global lock.
+
+    Every getData*/setData* call lands here, so the manager is slotted and
+    reads xp.Type_* flags as module constants rather than via fake_xp.
     """
 
+    __slots__ = (
+        "fake_xp",
+        "_handles",
+        "_refs_by_id",
+        "_handles_lock",
+        "_next_df_id",
+        "_next_owner_id",
+        "_last_updated",
+        "_batch_time",
+        "_stamp",
+        "_last_find",
+    )
+
     _handles: Dict[str, FakeDataRef]  # all known datarefs
-    _df_id_to_path: Dict[int, str]
+    _refs_by_id: List[Optional[FakeDataRef]]  # indexed by df_id; slot 0 unused
     _handles_lock: RLock
     _next_df_id: int
     _next_owner_id: int
+    _last_updated: float
+    _batch_time: Optional[float]
+    _stamp: Callable[[], float]  # change-stamp clock; swapped by batch_updates()
+    _last_find: Tuple[object, Optional[FakeDataRef]]  # find_handle() memo
 
     def __init__(self, fake_xp: FakeXP) -> None:
         self.fake_xp = fake_xp
 
         self._handles = {}
-        self._df_id_to_path = {}
+        self._refs_by_id = [None]
         self._handles_lock = threading.RLock()
         self._next_df_id = 1
         self._next_owner_id = 1
         self._last_updated = time.monotonic()
+        self._batch_time = None
+        self._stamp = time.monotonic
+        self._last_find = _NO_FIND
 
     @property
     def last_updated(self) -> float:
         return self._last_updated
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Coalesce change stamping for a burst of writes (e.g. one bridge poll).
+
+        Every add/write inside the block is stamped with a single timestamp
+        taken on entry instead of reading the clock per dataref. Nested
+        blocks reuse the outer timestamp.
+        """
+        if self._batch_time is not None:
+            yield
+            return
+
+        stamp = self._batch_time = time.monotonic()
+        self._stamp = lambda: stamp
+        try:
+            yield
+        finally:
+            self._batch_time = None
+            self._stamp = time.monotonic
+
     # ----------------------------------------------------------------------
     # Default values for real xp.Type_* flags
     # ----------------------------------------------------------------------
     def default_value_for(self, dtype: int, size: int) -> Any:
-        fxp = self.fake_xp
+        factory = _DEFAULT_FACTORIES.get(dtype)
+        if factory is not None:
+            return factory(size)
 
         # Arrays
-        if dtype & fxp.Type_FloatArray:
+        if dtype & Type_FloatArray:
             return [0.0] * size
-        if dtype & fxp.Type_IntArray:
+        if dtype & Type_IntArray:
             return [0] * size
-        if dtype & fxp.Type_Data:
+        if dtype & Type_Data:
             return bytearray(size)
 
         # Scalars
-        if dtype & fxp.Type_Float:
+        if dtype & Type_Float:
             return 0.0
-        if dtype & fxp.Type_Double:
+        if dtype & Type_Double:
             return 0.0
-        if dtype & fxp.Type_Int:
+        if dtype & Type_Int:
             return 0
 
         return 0.0  # default
@@ -90,46 +230,95 @@ class DataRefManager:
     # ----------------------------------------------------------------------
     def get_handle(self, name: str) -> Optional[FakeDataRef]:
         """Return the FakeDataRef for the given path, or None."""
-        with self._handles_lock:
-            return self._handles.get(str(name))
+        # Lock-free: a single dict.get is atomic under the GIL, and handles
+        # are only ever added/removed inside _handles_lock.
+        return self._handles.get(str(name))
+
+    def find_handle(self, name: str) -> FakeDataRef:
+        """Return the FakeDataRef for a path, creating a dummy if it is unknown."""
+        # Plugins commonly re-resolve the same path every frame; remember the
+        # last hit so that case skips the dict probe entirely. The memo is
+        # one tuple so a concurrent update can never pair a path with the
+        # wrong ref.
+        last_path, last_ref = self._last_find
+        if name is last_path or name == last_path:
+            return last_ref
+
+        # Dummies and promoted refs share one path-keyed dict, so a known
+        # path is a single probe. add_handle() re-checks under the lock (and
+        # normalizes non-str names) before creating a dummy.
+        ref = self._handles.get(name)
+        if ref is None:
+            ref = self.add_handle(name)
+        # Key the memo on the caller's own string: a plugin re-passing the
+        # same path constant every frame then matches on identity.
+        self._last_find = (name, ref)
+        return ref
+
+    def lookup_handle(self, ref_id: XPLMDataRef) -> Optional[FakeDataRef]:
+        """Return the FakeDataRef for a handle id, or None if it is not live."""
+        # Hot path for every getData*/setData* call. df_ids are allocated
+        # sequentially, so a list index replaces the id→path→ref dict hops.
+        # The df_id check rejects negative indices wrapping around.
+        try:
+            ref = self._refs_by_id[ref_id]
+        except (IndexError, TypeError):
+            return None
+        if ref is None or ref.df_id != ref_id:
+            return None
+        return ref
 
     def require_handle(self, ref_id: XPLMDataRef) -> FakeDataRef:
-        path = self._df_id_to_path.get(ref_id)
-        if path is None or path not in self._handles:
+        ref = self.lookup_handle(ref_id)
+        if ref is None:
             raise ValueError(f"Invalid handle: {ref_id}")
-        return self._handles[path]
+        return ref
 
     def add_handle(
             self,
             name: str,
     ) -> FakeDataRef:
-        """Register a new FakeDataRef handle."""
+        """Register a new FakeDataRef handle, or return the existing one for name."""
 
-        ref = self._create_dummy(name)
+        # Intern so the handle table, the DataRef cache and ref.path share
+        # one string object per path and probes between them hit on identity.
+        path = sys.intern(str(name))
 
         with self._handles_lock:
-            self._handles[str(name)] = ref
-            self._df_id_to_path[ref.df_id] = name
-        self._last_updated = time.monotonic()
+            # Another thread may have added the path since the caller's
+            # lock-free get_handle() miss.
+            existing = self._handles.get(path)
+            if existing is not None:
+                return existing
+
+            ref = self._create_dummy(path)  # allocates df_id: keep under lock
+            self._handles[path] = ref
+            self._refs_by_id.append(ref)  # index == df_id
+        self._last_updated = self._stamp()
 
         cache_info = self.fake_xp.dataref_cache.get_cached_info(ref.path)
         if cache_info is not None:
             self.promote(ref, dtype=cache_info.type, writable=cache_info.writable, array_size=cache_info.size,
                          cached=True)
             self.update_value(ref.df_id, ref.type, cache_info.value)
-        if cache_info is None:
-            print("hello")
+
+        self.fake_xp.dbg("[DataRef] %s -> df_id %d (%s)", ref.path, ref.df_id,
+                         "cached" if ref.cached else "dummy")
 
         return ref
 
     def del_handle(self, ref_id: XPLMDataRef) -> None:
         """Delete a FakeDataRef handle."""
-        path = self._df_id_to_path.get(ref_id)
-        if path is None:
+        try:
+            ref = self.require_handle(ref_id)
+        except ValueError:
             return
         with self._handles_lock:
-            del self._handles[path]
-        self._last_updated = time.monotonic()
+            self._refs_by_id[ref.df_id] = None
+            self._handles.pop(ref.path, None)
+            if self._last_find[1] is ref:
+                self._last_find = _NO_FIND
+        self._last_updated = self._stamp()
 
     def all_handle_paths(self) -> list[str]:
         """Return a snapshot of all known DataRef handle paths."""
@@ -142,7 +331,7 @@ class DataRefManager:
             return list(self._handles.values())
 
     def mark_modified(self, ref: FakeDataRef) -> None:
-        now = time.monotonic()
+        now = self._stamp()
         ref.last_modified = now
         self._last_updated = now
 
@@ -152,11 +341,11 @@ class DataRefManager:
         Defaults to scalar float type, size=1, value=0.0.
         Dummy refs can change type until promoted
         """
-        now = time.monotonic()
+        now = self._stamp()
         ref = FakeDataRef(
             path=path,
             df_id=XPLMDataRef(self._next_df_id),
-            type=self.fake_xp.Type_Float,
+            _type=Type_Float,
             writable=True,
             size=1,  # scalar
             value=0.0,
@@ -226,7 +415,7 @@ class DataRefManager:
         # ------------------------------------------------------------
         # 2. Compute new size BEFORE updating metadata
         # ------------------------------------------------------------
-        if dtype in (self.fake_xp.Type_IntArray, self.fake_xp.Type_FloatArray, self.fake_xp.Type_Data):
+        if dtype in _ARRAY_TYPES:
             if array_size is None or array_size < 0:
                 raise ValueError(f"{ref.path}: array promotion requires size")
             new_size: int = array_size
@@ -243,7 +432,7 @@ class DataRefManager:
         # 4. Update metadata
         # ------------------------------------------------------------
         with self._handles_lock:
-            ref.type = dtype
+            ref.set_type(dtype)
             ref.writable = writable
             ref.size = new_size
             ref.dummy = False
@@ -257,13 +446,18 @@ class DataRefManager:
             count: int = -1,
             values: Optional[list] = None,
     ):
-        fxp = self.fake_xp
-
         # ------------------------------------------------------------
         # 0. Resolve ref
         # ------------------------------------------------------------
         ref = self.require_handle(dr)
 
+        # Fast path: canonical scalar read as its own type (getDatai/getDataf
+        # polling). Shaping is a no-op and compatibility is implied here.
+        if values is None and ref.type == desired_type and ref.read_scalar is None:
+            cast_scalar = _SCALAR_CASTS.get(desired_type)
+            if cast_scalar is not None:
+                return cast_scalar(ref.value)
+
         # ------------------------------------------------------------
         # 1. Dummy shaping or type validation
         # ------------------------------------------------------------
@@ -276,7 +470,7 @@ class DataRefManager:
                 count=count,
             )
         else:
-            if not self._is_compatible(ref.type, desired_type):
+            if not _is_compatible(ref.type, desired_type):
                 raise TypeError(
                     f"{ref.path}: expected type {desired_type}, "
                     f"but DataRef is promoted as {ref.type}"
@@ -287,7 +481,7 @@ class DataRefManager:
         # ============================================================
         # 2. SCALAR REQUEST (desired_type is scalar)
         # ============================================================
-        if desired_type in (fxp.Type_Float, fxp.Type_Int, fxp.Type_Double):
+        if desired_type in _SCALAR_TYPES:
 
             # Underlying scalar
             if not ref.is_array:
@@ -312,11 +506,11 @@ class DataRefManager:
                     v = ref.value[0]
 
             # Normalize scalar to desired type
-            if desired_type == fxp.Type_Float:
+            if desired_type == Type_Float:
                 v = float(v)
-            elif desired_type == fxp.Type_Int:
+            elif desired_type == Type_Int:
                 v = int(v)
-            elif desired_type == fxp.Type_Double:
+            elif desired_type == Type_Double:
                 v = float(v)
 
             # Write into caller buffer?
@@ -342,9 +536,9 @@ class DataRefManager:
                 v = ref.value
 
             # Convert scalar → array of length 1
-            if desired_type == fxp.Type_FloatArray:
+            if desired_type == Type_FloatArray:
                 arr = [float(v)]
-            elif desired_type == fxp.Type_IntArray:
+            elif desired_type == Type_IntArray:
                 arr = [int(v)]
             else:
                 raise TypeError(f"{ref.path}: unsupported array desired_type {desired_type}")
@@ -373,8 +567,10 @@ class DataRefManager:
                 raise TypeError(f"{ref.path}: accessor array read failed") from e
 
             if values is not None:
-                values.clear()
-                values.extend(tmp[:got])
+                # Trim in place and copy once (not slice + extend)
+                if got < count:
+                    del tmp[got:]
+                values[:] = tmp
 
             return got
 
@@ -385,21 +581,21 @@ class DataRefManager:
             return 0
 
         count = min(count, size - offset)
-        slice_ = arr[offset: offset + count]
 
-        # Normalize array to desired type
-        if desired_type == fxp.Type_FloatArray:
-            result = [float(x) for x in slice_]
-        elif desired_type == fxp.Type_IntArray:
-            result = [int(x) for x in slice_]
-        else:
-            result = slice_
+        # Size query (values=None): nothing to copy or convert
+        if values is None:
+            return count
 
-        if values is not None:
-            values.clear()
-            values.extend(result)
+        # Canonical storage already holds ref.type's element type (every
+        # write casts on the way in), so a same-type read is one C-level
+        # slice copy; only cross-type reads convert per element.
+        cast_element = None if desired_type == ref_type else _ARRAY_CASTS.get(desired_type)
+        if cast_element is None:
+            values[:] = arr[offset: offset + count]
+        else:
+            values[:] = map(cast_element, arr[offset: offset + count])
 
-        return len(result)
+        return count
 
     def update_value(
             self,
@@ -432,10 +628,23 @@ class DataRefManager:
         if not ref.writable:
             raise ValueError(f"{ref.path}: writable=False")
 
+        # Fast path: canonical scalar write to a promoted ref of the same type
+        # (setDatai/setDataf in a plugin tick). No shaping, no accessor.
+        dummy = ref.dummy
+        if (
+                not dummy
+                and ref.type == expected_type
+                and ref.write_scalar is None
+                and expected_type in _SCALAR_CASTS
+        ):
+            self.mark_modified(ref)
+            self._canonical_scalar_write(ref, expected_type, value)
+            return ref.size
+
         # ------------------------------------------------------------
         # 1. Dummy shaping or type validation
         # ------------------------------------------------------------
-        if ref.dummy:
+        if dummy:
             inferred_count = (
                 len(value)
                 if isinstance(value, Sequence) and not isinstance(value, (str, bytes))
@@ -506,24 +715,28 @@ class DataRefManager:
                 raise ValueError(f"{ref.path}: array update requires iterable")
 
         # DATA arrays: strict bounds
-        if dtype & self.fake_xp.Type_Data:
+        if dtype & Type_Data:
             if offset < 0 or offset + count > size:
                 raise ValueError(f"{ref.path}: DATA write past end of buffer")
 
             buf = ref.value
             if isinstance(value, (bytes, bytearray)):
-                src = list(value)
+                # Already byte-ranged: copy straight across, no list round-trip
+                src = value[:count]
             elif isinstance(value, list) and all(isinstance(x, int) for x in value):
-                src = value
+                # Every element must be an int, written or not; the ones
+                # written are masked to a byte.
+                src = bytes([x & 0xFF for x in value[:count]])
             else:
+                src = None
+            if src is None:
                 raise ValueError(f"{ref.path}: DATA update requires bytes or list[int]")
 
-            # Pad with zeros if src is shorter than count
-            if len(src) < count:
-                src = src + [0] * (count - len(src))
-
-            for i in range(count):
-                buf[offset + i] = src[i] & 0xFF
+            # Same-length slice stores, zero-padding if src is shorter than count
+            n = len(src)
+            buf[offset: offset + n] = src
+            if n < count:
+                buf[offset + n: offset + count] = bytes(count - n)
 
             return count
 
@@ -533,19 +746,25 @@ class DataRefManager:
         if n == 0:
             return 0
 
-        arr = ref.value
-
-        if dtype & self.fake_xp.Type_FloatArray:
-            for i in range(n):
-                arr[offset + i] = float(value[i])
-
-        elif dtype & self.fake_xp.Type_IntArray:
-            for i in range(n):
-                arr[offset + i] = int(value[i])
-
+        if dtype & Type_FloatArray:
+            cast_element = float
+        elif dtype & Type_IntArray:
+            cast_element = int
         else:
             raise ValueError(f"{ref.path}: unsupported array dtype {dtype}")
 
+        # One C-level slice assignment instead of a per-index store loop.
+        # Negative offsets (which index from the end) and sources shorter
+        # than the clipped count keep the per-index loop, so they behave as
+        # before; a short source still raises IndexError.
+        arr = ref.value
+        src = value[:n] if offset >= 0 else None
+        if src is not None and len(src) == n:
+            arr[offset: offset + n] = map(cast_element, src)
+        else:
+            for i in range(n):
+                arr[offset + i] = cast_element(value[i])
+
         return n
 
     def shape_dummy(
@@ -565,7 +784,14 @@ class DataRefManager:
         if not ref.dummy:
             raise ValueError("Cannot shape a canonical dataref")
 
-        if ref.type != dtype:
+        same_type = ref.type == dtype
+
+        # Scalar access to an already scalar-shaped dummy: nothing to infer
+        if (same_type and ref.size == 1 and not ref.is_array
+                and not isinstance(value, (list, tuple, bytearray))):
+            return
+
+        if not same_type:
             ref.value = self.default_value_for(dtype, 1)
 
         dv = ref.value if value is None else value
@@ -577,30 +803,26 @@ class DataRefManager:
             new_size = max(offset + count, ref.size)
 
         # If same shape, do nothing
-        if ref.type == dtype and ref.size == new_size:
+        if same_type and ref.size == new_size:
             return
 
         # ------------------------------------------------------------
         # 3. Recast type + size and expand array if needed
         # ------------------------------------------------------------
         with self._handles_lock:
-            ref.type = dtype
+            ref.set_type(dtype)
             ref.size = new_size
 
-            # Get default for array type (list)
-            default_list = self.default_value_for(dtype, 1)
-
-            # Extract scalar element for expansion
-            if isinstance(default_list, (list, tuple, bytearray)):
-                default = default_list[0] if default_list else 0
-            else:
-                default = default_list
+            # Scalar element for expansion (no throwaway default container)
+            default = _element_default(dtype)
 
             if ref.is_array:
-                # Expand array while preserving existing values
-                if isinstance(ref.value, list):
-                    while len(ref.value) < new_size:
-                        ref.value.append(default)
+                # Expand array while preserving existing values: one extend
+                # for the whole shortfall (bytearray DATA storage included)
+                if isinstance(ref.value, (list, bytearray)):
+                    grow = new_size - len(ref.value)
+                    if grow > 0:
+                        ref.value.extend([default] * grow)
                 else:
                     # Convert scalar dummy to array
                     ref.value = [default] * new_size
@@ -612,19 +834,26 @@ class DataRefManager:
             self.mark_modified(ref)
 
     def _canonical_scalar_write(self, ref, dtype, value) -> None:
-        fxp = self.fake_xp
-
-        if dtype & (fxp.Type_Float | fxp.Type_Double):
+        # Exact-type checks settle the usual plain float/int values with a
+        # pointer compare; isinstance() still admits subclasses such as bool.
+        vtype = type(value)
+        if dtype & (Type_Float | Type_Double):
+            if vtype is float:
+                ref.value = value
+                return
             if not isinstance(value, (float, int)):
                 raise ValueError(f"{ref.path}: float scalar requires float")
             ref.value = float(value)
 
-        elif dtype & fxp.Type_Int:
+        elif dtype & Type_Int:
+            if vtype is int:
+                ref.value = value
+                return
             if not isinstance(value, int):
                 raise ValueError(f"{ref.path}: int scalar requires int")
             ref.value = int(value)
 
-        elif dtype & fxp.Type_Data:
+        elif dtype & Type_Data:
             try:
                 if isinstance(value, (bytes, bytearray)):
                     ref.value[0] = value[0] if value else 0
@@ -636,107 +865,6 @@ class DataRefManager:
         else:
             raise ValueError(f"{ref.path}: unsupported scalar dtype {dtype}")
 
-    def _canonical_array_write(self, ref, dtype, value, offset, count) -> int:
-        fxp = self.fake_xp
-
-        if count is None or count < 0:
-            try:
-                count = len(value)
-            except Exception:
-                raise ValueError(f"{ref.path}: array update requires iterable")
-
-        if offset < 0:
-            raise ValueError(f"{ref.path}: negative offset invalid")
-
-        size = ref.size
-
-        if offset >= size:
-            raise ValueError(f"{ref.path}: array write offset past end")
-
-        n = min(count, size - offset)
-        arr = ref.value
-
-        # FLOAT ARRAY
-        if dtype & fxp.Type_FloatArray:
-            if not isinstance(value, list) or not all(isinstance(x, (float, int)) for x in value):
-                raise ValueError(f"{ref.path}: FloatArray update requires list[float]")
-            for i in range(n):
-                arr[offset + i] = float(value[i])
-
-        # INT ARRAY
-        elif dtype & fxp.Type_IntArray:
-            if not isinstance(value, list) or not all(isinstance(x, int) for x in value):
-                raise ValueError(f"{ref.path}: IntArray update requires list[int]")
-            for i in range(n):
-                arr[offset + i] = int(value[i])
-
-        # DATA ARRAY
-        elif dtype & fxp.Type_Data:
-            if isinstance(value, (bytes, bytearray)):
-                src = list(value)
-            elif isinstance(value, list) and all(isinstance(x, int) for x in value):
-                src = value
-            else:
-                raise ValueError(f"{ref.path}: DATA update requires bytes or list[int]")
-
-            if len(src) < n:
-                src = src + [0] * (n - len(src))
-
-            for i in range(n):
-                arr[offset + i] = src[i] & 0xFF
-
-        else:
-            raise ValueError(f"{ref.path}: unsupported array dtype {dtype}")
-
-        return n
-
-    def _is_compatible(self, ref_type: int, desired_type: int) -> bool:
-        fxp = self.fake_xp
-
-        # ------------------------------------------------------------
-        # 1. Direct bitmask compatibility
-        # ------------------------------------------------------------
-        if (ref_type & desired_type) != 0:
-            return True
-
-        # ------------------------------------------------------------
-        # 2. Array → scalar (FloatArray→Float, IntArray→Int)
-        # ------------------------------------------------------------
-        if (ref_type & fxp.Type_FloatArray) and (desired_type & fxp.Type_Float):
-            return True
-        if (ref_type & fxp.Type_IntArray) and (desired_type & fxp.Type_Int):
-            return True
-
-        # ------------------------------------------------------------
-        # 3. Array → scalar (cross‑type)
-        #    FloatArray → Int
-        #    IntArray   → Float
-        # ------------------------------------------------------------
-        if (ref_type & fxp.Type_FloatArray) and (desired_type & fxp.Type_Int):
-            return True
-        if (ref_type & fxp.Type_IntArray) and (desired_type & fxp.Type_Float):
-            return True
-
-        # ------------------------------------------------------------
-        # 4. Scalar → array (Float→FloatArray, Int→IntArray)
-        # ------------------------------------------------------------
-        if (ref_type & fxp.Type_Float) and (desired_type & fxp.Type_FloatArray):
-            return True
-        if (ref_type & fxp.Type_Int) and (desired_type & fxp.Type_IntArray):
-            return True
-
-        # ------------------------------------------------------------
-        # 5. Scalar → array (cross‑type)
-        #    Float → IntArray
-        #    Int   → FloatArray
-        # ------------------------------------------------------------
-        if (ref_type & fxp.Type_Float) and (desired_type & fxp.Type_IntArray):
-            return True
-        if (ref_type & fxp.Type_Int) and (desired_type & fxp.Type_FloatArray):
-            return True
-
-        return False
-
     # ----------------------------------------------------------------------
     # Shape enforcement
     # ----------------------------------------------------------------------
@@ -8,6 +8,7 @@ from __future__ import annotations
 import base64
 import json
 import re
+import sys
 import time
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, Optional, Pattern, TYPE_CHECKING
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
     from simless.libs.fake_xp import FakeXP
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     path: str
     type: int
@@ -86,6 +87,7 @@ class DataRefCache:
                         continue
 
                     entry = CacheEntry.from_json(line)
+                    entry.path = sys.intern(entry.path)
                     self._cache[entry.path] = entry
 
         except FileNotFoundError:
@@ -283,11 +285,15 @@ class DataRefViewer:
             return
         if not self.fake_xp.isWidgetVisible(self.window):
             return
-        if self.fake_xp.dataref_manager.last_updated > self._last_dataref_render:
+        last_updated = self.fake_xp.dataref_manager.last_updated
+        if last_updated > self._last_dataref_render:
             self._dirty = True
         if not self._dirty:
             return
 
+        # Remember the change stamp this render covers, so a burst of writes
+        # between refreshes costs one render instead of one per refresh.
+        self._last_dataref_render = last_updated
         self._render_status()
         recent_changes = self._render_datarefs()
         if not recent_changes:
@@ -304,11 +310,11 @@ class DataRefViewer:
                             "  - ---- ------------------------------------------------------------ - -----"]
 
         recent = False
+        now = time.monotonic()
         for ref in self.fake_xp.dataref_manager.all_handles():
             if self._filter_regex and not self._filter_regex.search(ref.path):
                 continue
 
-            now = time.monotonic()
             mark = " "
             if now - ref.last_modified <= 10:
                 mark = "*"
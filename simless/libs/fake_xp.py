@@ -44,6 +44,7 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -65,6 +66,10 @@ from simless.libs.window import WindowManager
 from xp_typing import XPLMPluginID
 
 
+def _dbg_disabled(msg: str, *args: Any) -> None:
+    """FakeXP.dbg when debug logging is off: no formatting, no log() call."""
+
+
 class FakeXP(
     FakeXPDataRef,
     FakeXPWidget,
@@ -93,7 +98,7 @@ class FakeXP(
     ) -> None:
         self.enable_gui = enable_gui
         self.terminal_logging = terminal_logging
-        self.debug_logging = debug_logging
+        self.debug_logging = debug_logging  # binds dbg, see the setter
 
         self._xplane_root = Path(__file__).resolve().parents[2]
         self._xpp_log = self._xplane_root / "XPPython3Log.txt"
@@ -115,11 +120,6 @@ class FakeXP(
         self._init_flightloop()
         self._init_utilities()
 
-        # ------------------------------------------------------------------
-        # Bind constants
-        # ------------------------------------------------------------------
-        bind_xp_constants(self)
-
         # ------------------------------------------------------------------
         # Bind Modules
         # ------------------------------------------------------------------
@@ -154,15 +154,33 @@ class FakeXP(
 
         # Terminal-only mode
         if self.terminal_logging:
-            print(line, end="")
+            sys.stdout.write(line)
             return
 
         # File output (XPPython3 log only)
         with self._xpp_log.open("a", encoding="utf-8") as f:
             f.write(line)
 
-    def dbg(self, msg: str) -> None:
-        self.log(msg, debug=True)
+    @property
+    def debug_logging(self) -> bool:
+        return self._debug_logging
+
+    @debug_logging.setter
+    def debug_logging(self, enabled: bool) -> None:
+        self._debug_logging = enabled
+        if enabled:
+            self.__dict__.pop("dbg", None)
+        else:
+            # Shadow the method so disabled debug calls cost one plain call
+            self.dbg = _dbg_disabled
+
+    def dbg(self, msg: str, *args: Any) -> None:
+        """
+        Debug log with lazy %-style arguments: ``msg % args`` is only
+        formatted when debug logging is enabled, so hot call sites pay
+        nothing for their diagnostics otherwise.
+        """
+        self.log(msg % args if args else msg, debug=True)
 
     # ------------------------------------------------------------------
     # System log → Log.txt OR terminal
@@ -173,15 +191,15 @@ class FakeXP(
 
         # Terminal-only mode
         if self.terminal_logging:
-            print(line, end="")
+            sys.stdout.write(line)
             return
 
         # File output (X‑Plane Log.txt only)
         with self._sim_log.open("a", encoding="utf-8") as f:
             f.write(line)
 
-    def sys_log(self, msg: str) -> None:
-        self.systemLog(msg)
+    # Same function under its legacy name, not a forwarding method
+    sys_log = systemLog
 
     def getVersions(self):
         """
@@ -277,3 +295,8 @@ class FakeXP(
             return
         sender = self.getMyID()
         self.simless_runner.dispatch_message_to_plugin(plugin, sender, message, param)
+
+
+# xp constants are identical for every FakeXP, so bind them once on the class
+# instead of copying ~480 attributes into each instance at construction.
+bind_xp_constants(FakeXP)
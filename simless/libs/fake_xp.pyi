@@ -1142,6 +1142,10 @@ class FakeXP:
 
     def all_flightloop(self) -> list[FlightLoop]: ...
 
+    def pop_due_flightloops(self, now: float, cycle: int) -> list[tuple[int, FlightLoop]]: ...
+
+    def requeue_flightloop(self, fid: int) -> None: ...
+
     def getElapsedTime(self) -> float: ...
 
     def getCycleNumber(self) -> int: ...
@@ -1168,7 +1172,7 @@ class FakeXP:
 
     def log(self, msg: str, debug: bool = False) -> None: ...
 
-    def dbg(self, msg: str) -> None: ...
+    def dbg(self, msg: str, *args: Any) -> None: ...
 
     def systemLog(self, msg: str) -> None: ...
 
@@ -28,12 +28,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 def bind_xp_constants(xp) -> None:
     """
     Bind all module-level constants into the xp namespace.
     """
-    for name, val in globals().items():
+    for name, val in XP_CONSTANTS.items():
         setattr(xp, name, val)
 
 def lookup_constant_name(value: int, prefix: str) -> str:
@@ -43,10 +45,17 @@ def lookup_constant_name(value: int, prefix: str) -> str:
         lookup_constant_name(3005, "WidgetClass_") -> "Caption"
         lookup_constant_name(9010, "VK_") -> "A"
     """
-    for name, val in globals().items():
-        if name.startswith(prefix) and val == value:
-            return name.replace(prefix, "")
-    return f"Unknown({value})"
+    return _constants_by_value(prefix).get(value, f"Unknown({value})")
+
+
+@lru_cache(maxsize=None)
+def _constants_by_value(prefix: str) -> dict[object, str]:
+    """Reverse index (value -> short name) for one prefix, built on first use."""
+    index: dict[object, str] = {}
+    for name, val in XP_CONSTANTS.items():
+        if name.startswith(prefix):
+            index.setdefault(val, name.replace(prefix, ""))
+    return index
 
 
 # Data type bitmask
@@ -660,3 +669,14 @@ kXPLM_Version = 15101
 Menu_NoCheck = 16000  # Item cannot be checked
 Menu_Unchecked = 16001  # Item is checkable and currently unchecked
 Menu_Checked = 16002  # Item is checkable and currently checked
+
+
+# ----------------------------------------------------------------------
+# Constant table — built once at import so binding is a single loop over
+# the SDK names only (no module dunders, helpers or __future__ features).
+# ----------------------------------------------------------------------
+XP_CONSTANTS: dict[str, object] = {
+    _name: _val
+    for _name, _val in globals().items()
+    if not _name.startswith("_") and not callable(_val) and _name != "annotations"
+}
@@ -5,9 +5,9 @@
 # This module implements the full xp.* DataRef surface with production‑
 # parity semantics. It assumes that the composing class provides:
 #
-#   • self.dm._handles: Dict[str, FakeDataRef]
-#   • self.dm._accessors: Dict[str, Dict[str, Any]]
-#   • self.dm._handles_lock: threading.RLock
+#   • self.dataref_manager._handles: Dict[str, FakeDataRef]
+#   • self.dataref_manager._accessors: Dict[str, Dict[str, Any]]
+#   • self.dataref_manager._handles_lock: threading.RLock
 #
 # In addition, this API expects the composing FakeXPDataRef to expose
 # explicit promotion methods:
@@ -21,15 +21,42 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Callable, List, MutableSequence, Optional, Sequence, TYPE_CHECKING, Tuple, cast
 
 from simless.libs.dataref import DataRefManager
+from simless.libs.fake_xp_constants import (Type_Data, Type_Double, Type_Float, Type_FloatArray, Type_Int,
+                                            Type_IntArray)
 from xp_typing import XPLMDataRef, XPLMDataRefInfo_t, XPLMDataTypeID
 
 if TYPE_CHECKING:
     from simless.libs.fake_xp import FakeXP
 
 
+@lru_cache(maxsize=64)
+def _choose_dtype_from_mask(mask: int) -> Tuple[int, bool, int]:
+    """
+    Choose an xp.Type_* dtype, is_array, and default size from a bitmask.
+    Default array size is 1 for scalars, 8 for common arrays (arbitrary).
+    Pure in the mask (six type bits), so results are cached.
+    """
+    if mask & Type_FloatArray:
+        return Type_FloatArray, True, 8
+    if mask & Type_IntArray:
+        return Type_IntArray, True, 8
+    if mask & Type_Data:
+        return Type_Data, True, 256
+    if mask & Type_Double:
+        return Type_Double, False, 1
+    if mask & Type_Float:
+        return Type_Float, False, 1
+    if mask & Type_Int:
+        return Type_Int, False, 1
+
+    # Fallback: float scalar
+    return Type_Float, False, 1
+
+
 class FakeXPDataRef:
     """
     Public xp.* DataRef API implementation.
@@ -38,34 +65,35 @@ class FakeXPDataRef:
     It does not own lifecycle or bridge wiring.
     """
 
+    # Assigned by FakeXP.__init__
+    dataref_manager: DataRefManager
+
     @property
     def fake_xp(self) -> FakeXP:
         return cast("FakeXP", cast(object, self))
 
-    @property
-    def dm(self) -> DataRefManager:
-        return self.fake_xp.dataref_manager
-
     # ------------------------------------------------------------------
     # Lookup / dummy creation
     # ------------------------------------------------------------------
     def findDataRef(self, name: str) -> Optional[XPLMDataRef]:
-        existing = self.dm.get_handle(name)
-        if existing is not None:
-            return existing.df_id
-
-        return self.dm.add_handle(name).df_id
+        return self.dataref_manager.find_handle(name).df_id
 
     # ------------------------------------------------------------------
     # Introspection
     # ------------------------------------------------------------------
     def getDataRefTypes(self, dataRef: XPLMDataRef) -> XPLMDataTypeID | int:
-        return self.dm.require_handle(dataRef).type
+        return self.dataref_manager.require_handle(dataRef).type
 
     def getDataRefInfo(self, dataRef: XPLMDataRef) -> XPLMDataRefInfo_t:
-        ref = self.dm.require_handle(dataRef)
+        ref = self.dataref_manager.require_handle(dataRef)
+
+        # Production semantics:
+        #   • Dummy refs report size = 0
+        #   • Promoted refs report actual size
+        size = ref.size if not ref.dummy else 0
 
-        # Base XPLM fields
+        # Built fresh per call: the info object is mutable, so a shared
+        # instance would let one caller corrupt every later result.
         info = XPLMDataRefInfo_t(
             name=ref.path,
             type=ref.type,
@@ -75,37 +103,31 @@ class FakeXPDataRef:
 
         # XPLMGetDataRefInfo adds these dynamically
         setattr(info, "is_array", ref.is_array)
-
-        # Production semantics:
-        #   • Dummy refs report size = 0
-        #   • Promoted refs report actual size
-        size = ref.size if not ref.dummy else 0
         setattr(info, "size", size)
 
         return info
 
     def canWriteDataRef(self, dataRef: XPLMDataRef) -> bool:
-        return self.dm.require_handle(dataRef).writable
+        return self.dataref_manager.require_handle(dataRef).writable
 
     def isDataRefGood(self, dataRef: XPLMDataRef) -> bool:
-        try:
-            self.dm.require_handle(dataRef)
-            return True
-        except Exception:
-            return False
+        # Probe without raising: stale handles are an expected answer here
+        return self.dataref_manager.lookup_handle(dataRef) is not None
 
     # ================================================================
     #  SCALAR GETTERS (thin wrappers)
     # ================================================================
 
+    # get_value() already normalizes scalar reads to the requested type.
+
     def getDatai(self, dr: XPLMDataRef) -> int:
-        return int(self.dm.get_value(dr, self.fake_xp.Type_Int))
+        return self.dataref_manager.get_value(dr, Type_Int)
 
     def getDataf(self, dr: XPLMDataRef) -> float:
-        return float(self.dm.get_value(dr, self.fake_xp.Type_Float))
+        return self.dataref_manager.get_value(dr, Type_Float)
 
-    def getDatad(self, dr: XPLMDataRef) -> float:
-        return self.getDataf(dr)
+    # Doubles are stored as Python floats, so getDatad is getDataf.
+    getDatad = getDataf
 
     # ================================================================
     #  ARRAY GETTERS (thin wrappers)
@@ -118,7 +140,7 @@ class FakeXPDataRef:
             offset: int = 0,
             count: int = -1
     ) -> int:
-        return self.dm.get_value(dr, self.fake_xp.Type_IntArray, offset, count, values)
+        return self.dataref_manager.get_value(dr, Type_IntArray, offset, count, values)
 
     def getDatavf(
             self,
@@ -127,7 +149,7 @@ class FakeXPDataRef:
             offset: int = 0,
             count: int = -1
     ) -> int:
-        return self.dm.get_value(dr, self.fake_xp.Type_FloatArray, offset, count, values)
+        return self.dataref_manager.get_value(dr, Type_FloatArray, offset, count, values)
 
     def getDatab(
             self,
@@ -136,25 +158,27 @@ class FakeXPDataRef:
             offset: int = 0,
             count: int = -1
     ) -> int:
-        return self.dm.get_value(dr, self.fake_xp.Type_Data, offset, count, values)
+        return self.dataref_manager.get_value(dr, Type_Data, offset, count, values)
 
     # ================================================================
     #  SCALAR SETTERS (thin wrappers)
     # ================================================================
 
     def setDatai(self, dr: XPLMDataRef, v: int) -> None:
-        self.dm.update_value(dr, self.fake_xp.Type_Int, v)
+        self.dataref_manager.update_value(dr, Type_Int, v)
 
     def setDataf(self, dr: XPLMDataRef, v: float) -> None:
-        self.dm.update_value(dr, self.fake_xp.Type_Float, v)
+        self.dataref_manager.update_value(dr, Type_Float, v)
 
-    def setDatad(self, dr: XPLMDataRef, v: float) -> None:
-        self.setDataf(dr, v)
+    setDatad = setDataf
 
     # ================================================================
     #  ARRAY SETTERS (thin wrappers)
     # ================================================================
 
+    # update_value() is the single generic setter and always returns the
+    # element count, so these forward its result unchanged.
+
     def setDatavi(
             self,
             dr: XPLMDataRef,
@@ -162,9 +186,7 @@ class FakeXPDataRef:
             offset: int = 0,
             count: int = -1
     ) -> int:
-        written = self.dm.update_value(dr, self.fake_xp.Type_IntArray, values, offset, count)
-        assert written is not None
-        return written
+        return self.dataref_manager.update_value(dr, Type_IntArray, values, offset, count)
 
     def setDatavf(
             self,
@@ -173,9 +195,7 @@ class FakeXPDataRef:
             offset: int = 0,
             count: int = -1
     ) -> int:
-        written = self.dm.update_value(dr, self.fake_xp.Type_FloatArray, values, offset, count)
-        assert written is not None
-        return written
+        return self.dataref_manager.update_value(dr, Type_FloatArray, values, offset, count)
 
     def setDatab(
             self,
@@ -184,9 +204,7 @@ class FakeXPDataRef:
             offset: int = 0,
             count: int = -1
     ) -> int:
-        written = self.dm.update_value(dr, self.fake_xp.Type_Data, values, offset, count)
-        assert written is not None
-        return written
+        return self.dataref_manager.update_value(dr, Type_Data, values, offset, count)
 
     def getDatas(
             self,
@@ -203,22 +221,24 @@ class FakeXPDataRef:
         • Stops at first NUL
         • Returns UTF‑8 decoded string
         """
-        buf: list[int] = []
+        # A bytearray buffer takes the canonical DATA slice as one memcpy and
+        # needs no list → bytes conversion afterwards
+        buf = bytearray()
 
-        n = self.fake_xp.dataref_manager.get_value(
+        n = self.dataref_manager.get_value(
             dr,
-            desired_type=self.fake_xp.Type_Data,
+            desired_type=Type_Data,
             offset=offset,
             count=count,
             values=buf,
         )
 
-        raw = bytes(buf[:n])
-
-        nul = raw.find(b"\x00")
-        if nul >= 0:
-            raw = raw[:nul]
+        # get_value() fills buf with exactly n elements; trim only if not
+        if len(buf) != n:
+            del buf[n:]
 
+        # Stop at the first NUL
+        raw = buf.partition(b"\x00")[0]
         return raw.decode("utf-8", errors="ignore")
 
     def setDatas(
@@ -238,9 +258,9 @@ class FakeXPDataRef:
         """
         encoded = value.encode("utf-8")
 
-        self.fake_xp.dataref_manager.update_value(
+        self.dataref_manager.update_value(
             dr=dr,
-            expected_type=self.fake_xp.Type_Data,
+            expected_type=Type_Data,
             value=encoded,
             offset=offset,
             count=count,
@@ -308,7 +328,7 @@ class FakeXPDataRef:
         # ------------------------------------------------------------
         # 3. Determine dtype + shape
         # ------------------------------------------------------------
-        dtype, is_array, size = self._choose_dtype_from_mask(mask)
+        dtype, is_array, size = _choose_dtype_from_mask(mask)
 
         # ------------------------------------------------------------
         # 4. Select correct callbacks based on dtype
@@ -326,14 +346,12 @@ class FakeXPDataRef:
         # ------------------------------------------------------------
         # 5. Create or retrieve the FakeDataRef
         # ------------------------------------------------------------
-        ref = self.dm.get_handle(name)
-        if ref is None:
-            ref = self.dm.add_handle(name)
+        ref = self.dataref_manager.add_handle(name)
 
         # ------------------------------------------------------------
         # 6. Promote dummy → accessor-backed DataRef
         # ------------------------------------------------------------
-        self.dm.promote(
+        self.dataref_manager.promote(
             ref=ref,
             dtype=dtype,
             writable=writable_flag,
@@ -362,7 +380,7 @@ class FakeXPDataRef:
                 - If promoted (size > 0) → keep and revert to internal storage.
                 - If not promoted → delete.
         """
-        ref = self.fake_xp.dataref_manager.require_handle(dataRef)
+        ref = self.dataref_manager.require_handle(dataRef)
 
         # Remove accessor callbacks
         ref.read_scalar = None
@@ -377,7 +395,7 @@ class FakeXPDataRef:
             if ref.size and ref.size > 0:
                 return  # keep internal storage
 
-        self.fake_xp.dataref_manager.del_handle(dataRef)
+        self.dataref_manager.del_handle(dataRef)
 
     # -------------------------
     # Helpers for registerDataAccessor
@@ -412,26 +430,3 @@ class FakeXPDataRef:
     def _bitmask_is_array(self, mask: int) -> bool:
         fxp = self.fake_xp
         return bool(mask & (fxp.Type_FloatArray | fxp.Type_IntArray | fxp.Type_Data))
-
-    def _choose_dtype_from_mask(self, mask: int) -> Tuple[int, bool, int]:
-        """
-        Choose an xp.Type_* dtype, is_array, and default size from a bitmask.
-        Default array size is 1 for scalars, 8 for common arrays (arbitrary).
-        """
-        fxp = self.fake_xp
-
-        if mask & fxp.Type_FloatArray:
-            return fxp.Type_FloatArray, True, 8
-        if mask & fxp.Type_IntArray:
-            return fxp.Type_IntArray, True, 8
-        if mask & fxp.Type_Data:
-            return fxp.Type_Data, True, 256
-        if mask & fxp.Type_Double:
-            return fxp.Type_Double, False, 1
-        if mask & fxp.Type_Float:
-            return fxp.Type_Float, False, 1
-        if mask & fxp.Type_Int:
-            return fxp.Type_Int, False, 1
-
-        # Fallback: float scalar
-        return fxp.Type_Float, False, 1
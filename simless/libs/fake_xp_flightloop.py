@@ -5,7 +5,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, cast, Dict, TYPE_CHECKING
+import heapq
+import math
+from typing import Any, Callable, cast, Dict, List, Tuple, TYPE_CHECKING
 
 from simless.libs.flightloop import FlightLoop
 from xp_typing import XPLMFlightLoopPhaseType, XPLMFlightLoopID
@@ -38,13 +40,55 @@ class FakeXPFlightLoop:
         FakeXPFlightLoop owns:
           • Struct metadata (callback, refcon, phase, structSize, etc.)
           • A read-only timing mirror (populated by SimlessRunner)
+          • Min-heaps of (next_call, fid) and (next_cycle, fid) so the runner
+            only touches loops that are due. Entries are invalidated lazily:
+            a popped entry is stale unless it still matches the struct.
         """
         self._flightloop_structs: Dict[int, FlightLoop] = {}
         self._next_flightloop_id: int = 1
+        self._flightloop_time_queue: List[Tuple[float, int]] = []
+        self._flightloop_cycle_queue: List[Tuple[int, int]] = []
 
     def all_flightloop(self) -> list[FlightLoop]:
         return list(self._flightloop_structs.values())
 
+    def pop_due_flightloops(self, now: float, cycle: int) -> list[tuple[int, FlightLoop]]:
+        """
+        Pop every flightloop due at (now, cycle), in creation order.
+
+        The caller must hand each fid back via requeue_flightloop() once the
+        loop has run so its next deadline is queued.
+        """
+        structs = self._flightloop_structs
+        due: Dict[int, FlightLoop] = {}
+
+        time_queue = self._flightloop_time_queue
+        while time_queue and time_queue[0][0] <= now:
+            when, fid = heapq.heappop(time_queue)
+            fl = structs.get(fid)
+            if fl is not None and fl.next_call == when:
+                due[fid] = fl
+
+        cycle_queue = self._flightloop_cycle_queue
+        while cycle_queue and cycle_queue[0][0] <= cycle:
+            when_cycle, fid = heapq.heappop(cycle_queue)
+            fl = structs.get(fid)
+            if fl is not None and fl.next_cycle == when_cycle:
+                due[fid] = fl
+
+        return sorted(due.items())
+
+    def requeue_flightloop(self, fid: int) -> None:
+        """Queue the current deadline of a flightloop (no-op if destroyed)."""
+        fl = self._flightloop_structs.get(fid)
+        if fl is None:
+            return
+
+        if fl.next_call != math.inf:
+            heapq.heappush(self._flightloop_time_queue, (fl.next_call, fid))
+        if fl.next_cycle is not None:
+            heapq.heappush(self._flightloop_cycle_queue, (fl.next_cycle, fid))
+
     def getElapsedTime(self) -> float:
         """
             Return elapsed time since sim started.
@@ -83,6 +127,7 @@ class FakeXPFlightLoop:
     def destroyFlightLoop(self, fid: int) -> None:
         """
         Remove struct metadata and any runner-populated timing mirror.
+        Queued deadlines are dropped lazily by pop_due_flightloops().
         """
         self._flightloop_structs.pop(fid, None)
 
@@ -106,6 +151,7 @@ class FakeXPFlightLoop:
             now=now,
             cycle=cycle,
         )
+        self.requeue_flightloop(flightLoopID)
 
     def isFlightLoopValid(self, flightLoopID: XPLMFlightLoopID) -> bool:
         """
@@ -43,6 +43,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Callable, List, Optional, Sequence, TYPE_CHECKING, Tuple, cast
 
 from simless.libs.fake_xp_types import DPGOp, XPGeom
@@ -54,15 +55,19 @@ if TYPE_CHECKING:
     from simless.libs.fake_xp import FakeXP
 
 
+@lru_cache(maxsize=64)
+def _number_format_spec(digits: int, decimals: int) -> str:
+    """Format spec for drawNumber; plugins reuse a handful of widths per frame."""
+    return f"{digits}.{decimals}f"
+
+
 class FakeXPGraphics:
+    graphics_manager: GraphicsManager
+
     @property
     def fake_xp(self) -> FakeXP:
         return cast(FakeXP, cast(object, self))
 
-    @property
-    def gm(self) -> GraphicsManager:
-        return self.fake_xp.graphics_manager
-
     def createWindowEx(
             self,
             left: int = 100,
@@ -130,8 +135,8 @@ class FakeXPGraphics:
         self.fake_xp.window_manager.destroy_window(wid)
 
         # Backend cleanup
-        self.gm.enqueue_dpg(DPGOp.DELETE_ITEM, args=(info.drawlist_tag,))
-        self.gm.enqueue_dpg(DPGOp.DELETE_ITEM, args=(info.dpg_tag,))
+        self.graphics_manager.enqueue_dpg(DPGOp.DELETE_ITEM, args=(info.drawlist_tag,))
+        self.graphics_manager.enqueue_dpg(DPGOp.DELETE_ITEM, args=(info.dpg_tag,))
 
     def getWindowGeometry(self, wid: XPLMWindowID):
         info = self.fake_xp.window_manager.require_info(wid)
@@ -157,7 +162,7 @@ class FakeXPGraphics:
         info = self.fake_xp.window_manager.require_info(wid)
         info.visible = bool(visible)
 
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.CONFIGURE_ITEM,
             args=(info.dpg_tag,),
             kwargs=dict(show=info.visible),
@@ -176,7 +181,7 @@ class FakeXPGraphics:
             phase: int,
             wantsBefore: int,
     ) -> None:
-        self.gm.register_draw_callback(cb, phase, wantsBefore)
+        self.graphics_manager.register_draw_callback(cb, phase, wantsBefore)
 
     def unregisterDrawCallback(
             self,
@@ -184,13 +189,13 @@ class FakeXPGraphics:
             phase: int,
             wantsBefore: int,
     ) -> None:
-        self.gm.unregister_draw_callback(cb, phase, wantsBefore)
+        self.graphics_manager.unregister_draw_callback(cb, phase, wantsBefore)
 
     # ----------------------------------------------------------------------
     # TEXT DRAWING (DEFERRED DPG COMMAND)
     # ----------------------------------------------------------------------
     def drawString(self, color, x, y, text, wordWrap, fontID) -> None:
-        gm = self.gm
+        gm = self.graphics_manager
 
         active = gm.get_active_drawlist()
         if active is None:
@@ -235,14 +240,14 @@ class FakeXPGraphics:
             digits: int,
             decimals: int,
     ) -> None:
-        fmt = f"{{:{digits}.{decimals}f}}"
-        self.drawString(color, x, y, fmt.format(number), 0, 0)
+        text = format(number, _number_format_spec(digits, decimals))
+        self.drawString(color, x, y, text, 0, 0)
 
     # ----------------------------------------------------------------------
     # GRAPHICS STATE (STUB)
     # ----------------------------------------------------------------------
+    @staticmethod
     def setGraphicsState(
-            self,
             fog: int,
             lighting: int,
             alpha: int,
@@ -257,7 +262,7 @@ class FakeXPGraphics:
     # TEXTURE API (STUB)
     # ----------------------------------------------------------------------
     def generateTextureNumbers(self, count: int) -> List[int]:
-        gm = self.gm
+        gm = self.graphics_manager
         ids: List[int] = []
         for _ in range(count):
             tid = gm._next_tex_id
@@ -266,11 +271,12 @@ class FakeXPGraphics:
             ids.append(tid)
         return ids
 
-    def bindTexture2d(self, textureID: int, unit: int) -> None:
+    @staticmethod
+    def bindTexture2d(textureID: int, unit: int) -> None:
         return
 
     def deleteTexture(self, textureID: int) -> None:
-        self.gm._textures.pop(textureID, None)
+        self.graphics_manager._textures.pop(textureID, None)
 
     # ----------------------------------------------------------------------
     # XP-STYLE PRIMITIVES (DEFERRED)
@@ -282,7 +288,7 @@ class FakeXPGraphics:
             right: int,
             bottom: int,
     ) -> None:
-        gm = self.gm
+        gm = self.graphics_manager
 
         active = gm.get_active_drawlist()
         if active is None:
@@ -315,18 +321,18 @@ class FakeXPGraphics:
 
     def getScreenSize(self) -> Tuple[int, int]:
         return (
-            self.gm.dpg_get_viewport_client_width(),
-            self.gm.dpg_get_viewport_client_height(),
+            self.graphics_manager.dpg_get_viewport_client_width(),
+            self.graphics_manager.dpg_get_viewport_client_height(),
         )
 
     def getMouseLocation(self) -> Tuple[int, int]:
-        x, y = self.gm.dpg_get_mouse_pos()
+        x, y = self.graphics_manager.dpg_get_mouse_pos()
         return int(x), int(y)
 
     def getFontDimensions(self, font_id: XPLMFontID) -> tuple[int, int, int]:
         # Basic, XP-authentic defaults
         digits_only = 0
-        s = self.gm.dpg_get_text_size("L")
+        s = self.graphics_manager.dpg_get_text_size("L")
         if s is None:
             if font_id == self.fake_xp.Font_Proportional:
                 return 6, 12, digits_only  # dpg not ready
@@ -336,7 +342,7 @@ class FakeXPGraphics:
     def measureString(self, font_id: XPLMFontID, string: str) -> float:
         # Basic, XP-authentic defaults
         digits_only = 0
-        s = self.gm.dpg_get_text_size(string)
+        s = self.graphics_manager.dpg_get_text_size(string)
         if s is None:
             if font_id == self.fake_xp.Font_Proportional:
                 return 6 * len(string)  # dpg not ready
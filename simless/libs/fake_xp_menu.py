@@ -15,18 +15,13 @@ if TYPE_CHECKING:
 
 
 class FakeXPMenu:
+    graphics_manager: GraphicsManager
+    menu_manager: MenuManager
+
     @property
     def fake_xp(self) -> FakeXP:
         return cast(FakeXP, cast(object, self))
 
-    @property
-    def gm(self) -> GraphicsManager:
-        return self.fake_xp.graphics_manager
-
-    @property
-    def mm(self) -> MenuManager:
-        return self.fake_xp.menu_manager
-
     def createMenu(
             self,
             name: Optional[str] = None,
@@ -48,22 +43,22 @@ class FakeXPMenu:
         # 2. Resolve parent menu
         # ------------------------------------------------------------
         if parentMenuID is None:
-            parent_menu = self.mm.root_menu
+            parent_menu = self.menu_manager.root_menu
         else:
             # parentMenuID / parentItem specifies a submenu item
-            parent_item = self.mm.get_menu_item(parentMenuID, parentItem)
+            parent_item = self.menu_manager.get_menu_item(parentMenuID, parentItem)
             if parent_item is None:
                 return None
             if parent_item.submenu_id is None:
                 return None
-            parent_menu = self.mm.get_menu(parent_item.submenu_id)
+            parent_menu = self.menu_manager.get_menu(parent_item.submenu_id)
             if parent_menu is None:
                 return None
 
         # ------------------------------------------------------------
         # 3. Create submenu MenuRecord
         # ------------------------------------------------------------
-        submenu = self.mm.create_menu_record(
+        submenu = self.menu_manager.create_menu_record(
             name=menu_name,
             parent_dpg_tag=parent_menu.dpg_tag,  # submenu attaches to parent menu
             refcon=refCon,
@@ -73,7 +68,7 @@ class FakeXPMenu:
         # ------------------------------------------------------------
         # 4. ALWAYS append a new item to the parent menu
         # ------------------------------------------------------------
-        self.mm.append_menu_item_record(
+        self.menu_manager.append_menu_item_record(
             menu_rec=parent_menu,
             name=menu_name,
             refcon=refCon,
@@ -87,7 +82,7 @@ class FakeXPMenu:
         # ------------------------------------------------------------
         # 5. Create DPG menu under the parent menu
         # ------------------------------------------------------------
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.ADD_MENU,
             args=(),
             kwargs={
@@ -106,12 +101,12 @@ class FakeXPMenu:
             refCon: Any = None,
     ) -> int:
         # Resolve and validate menu
-        menu_rec = self.mm.get_menu(menuID)
+        menu_rec = self.menu_manager.get_menu(menuID)
         if menu_rec is None:
             return -1
 
         # Create authoritative item record
-        item_idx = self.mm.append_menu_item_record(
+        item_idx = self.menu_manager.append_menu_item_record(
             menu_rec=menu_rec,
             name=name,
             refcon=refCon,
@@ -124,7 +119,7 @@ class FakeXPMenu:
         item_rec = menu_rec.items[item_idx]
 
         # Create DPG item
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.ADD_MENU_ITEM,
             args=(),
             kwargs={
@@ -145,12 +140,12 @@ class FakeXPMenu:
             commandRef: XPLMCommandRef | None = None,
     ) -> int:
         # Resolve and validate menu
-        menu_rec = self.mm.get_menu(menuID)
+        menu_rec = self.menu_manager.get_menu(menuID)
         if menu_rec is None:
             return -1
 
         # Create authoritative item record
-        item_idx: int = self.mm.append_menu_item_record(
+        item_idx: int = self.menu_manager.append_menu_item_record(
             menu_rec=menu_rec,
             name=name,
             refcon=None,  # XP: command-backed menu items do not use refCon
@@ -163,7 +158,7 @@ class FakeXPMenu:
         item_rec = menu_rec.items[item_idx]
 
         # Enqueue DPG creation
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.ADD_MENU_ITEM,
             args=(),
             kwargs={
@@ -179,12 +174,12 @@ class FakeXPMenu:
 
     def appendMenuSeparator(self, menuID: Optional[XPLMMenuID] = None) -> Optional[int]:
         # Resolve and validate menu
-        menu_rec = self.mm.get_menu(menuID)
+        menu_rec = self.menu_manager.get_menu(menuID)
         if menu_rec is None:
             return -1
 
         # Insert separator record
-        item_idx = self.mm.append_menu_item_record(
+        item_idx = self.menu_manager.append_menu_item_record(
             menu_rec=menu_rec,
             name="",
             refcon=None,
@@ -197,7 +192,7 @@ class FakeXPMenu:
         item_rec = menu_rec.items[item_idx]
 
         # Enqueue DPG separator
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.ADD_MENU_ITEM,
             args=(),
             kwargs={
@@ -214,13 +209,13 @@ class FakeXPMenu:
 
     def setMenuItemName(self, menuID: Optional[XPLMMenuID], index: int, name: str) -> None:
         # Resolve and validate item
-        item_rec = self.mm.get_menu_item(menuID, index)
+        item_rec = self.menu_manager.get_menu_item(menuID, index)
         if item_rec is None:
             return
 
         item_rec.name = name
 
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.CONFIGURE_ITEM,
             args=(item_rec.dpg_tag,),
             kwargs={"label": item_rec.name},
@@ -236,7 +231,7 @@ class FakeXPMenu:
             checked = self.fake_xp.Menu_Checked
 
         # Resolve and validate item
-        item_rec = self.mm.get_menu_item(menuID, index)
+        item_rec = self.menu_manager.get_menu_item(menuID, index)
         if item_rec is None:
             return
 
@@ -244,7 +239,7 @@ class FakeXPMenu:
         item_rec.checked = checked
 
         # Minimal DPG operator set
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.CONFIGURE_ITEM,
             args=(item_rec.dpg_tag,),
             kwargs={"check": (checked == self.fake_xp.Menu_Checked)},
@@ -257,11 +252,11 @@ class FakeXPMenu:
             enabled: int = 1,
     ) -> None:
         # Resolve and validate item
-        item_rec = self.mm.get_menu_item(menuID, index)
+        item_rec = self.menu_manager.get_menu_item(menuID, index)
         if item_rec is None:
             return
 
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.CONFIGURE_ITEM,
             args=(item_rec.dpg_tag,),
             kwargs={"enabled": bool(enabled)},
@@ -269,22 +264,22 @@ class FakeXPMenu:
 
     def removeMenuItem(self, menuID: Optional[XPLMMenuID], index: int) -> None:
         # Resolve parent menu
-        menu_rec = self.mm.get_menu(menuID)
+        menu_rec = self.menu_manager.get_menu(menuID)
         if menu_rec is None:
             return
 
         # Resolve item
-        item_rec = self.mm.get_menu_item(menuID, index)
+        item_rec = self.menu_manager.get_menu_item(menuID, index)
         if item_rec is None:
             return
 
         # If this item has a submenu, delete the menu (dict entry)
-        if item_rec.submenu is not None:
-            del self.mm._menus[item_rec.submenu.menu_id]
-            item_rec.submenu = None
+        if item_rec.submenu_id is not None:
+            self.menu_manager._menus.pop(item_rec.submenu_id, None)
+            item_rec.submenu_id = None
 
         # Remove DPG item
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.DELETE_ITEM,
             args=(item_rec.dpg_tag,),
             kwargs={},
@@ -295,12 +290,12 @@ class FakeXPMenu:
 
     def destroyMenu(self, menuID: XPLMMenuID) -> None:
         # 1. Resolve menu record
-        menu_rec = self.mm.get_menu(menuID)
+        menu_rec = self.menu_manager.get_menu(menuID)
         if menu_rec is None:
             return
 
         # 2. Find parent menu by matching parent_dpg_tag
-        parent_menu = self.mm.get_menu_by_tag(menu_rec.parent_dpg_tag)
+        parent_menu = self.menu_manager.get_menu_by_tag(menu_rec.parent_dpg_tag)
         if parent_menu is not None:
             # 3. Remove the item whose submenu_id == menuID
             for idx, item in enumerate(parent_menu.items):
@@ -309,19 +304,19 @@ class FakeXPMenu:
                     break
 
         # 4. Delete DPG menu widget
-        self.gm.enqueue_dpg(
+        self.graphics_manager.enqueue_dpg(
             DPGOp.DELETE_ITEM,
             args=(menu_rec.dpg_tag,),
             kwargs={},
         )
 
         # 5. Delete authoritative menu record
-        del self.mm._menus[menuID]
+        del self.menu_manager._menus[menuID]
 
     def _dispatch_menu_click(self, sender, app_data, user_data):
         item_dpg_tag = sender
         menu_id = user_data
-        menu_rec = self.mm.get_menu(menu_id)
+        menu_rec = self.menu_manager.get_menu(menu_id)
         if menu_rec is None:
             raise KeyError(f"[FakeXP] Unknown menu_id: {menu_id}")
 
@@ -341,6 +336,15 @@ class FakeXPMenu:
 
 
 class MenuManager:
+    __slots__ = (
+        "fake_xp",
+        "_menus",
+        "_next_menu_idx",
+        "_menu_commands",
+        "_next_command_idx",
+        "_root_plugins_menu",
+    )
+
     _menus: Dict[XPLMMenuID, MenuRecord]
     _next_menu_idx: int
     _menu_commands: Dict[XPLMCommandRef, Callable[[XPLMCommandRef, XPLMCommandPhase, Any], None]]
@@ -25,6 +25,7 @@ WriteArray = Callable[
     None
 ]
 
+_ARRAY_TYPE_MASK = Type_FloatArray | Type_IntArray | Type_Data
 
 
 class XPShutdown(Exception):
@@ -35,6 +36,8 @@ class XPShutdown(Exception):
 class FakeXPCommandRef:
     """Opaque, hashable command reference object."""
 
+    __slots__ = ("path",)
+
     def __init__(self, path: str) -> None:
         self.path = path
 
@@ -78,7 +81,7 @@ class FakeDataRef:
     # -------------------------
     # Type & shape (authoritative)
     # -------------------------
-    type: XPLMDataTypeID | int  # xp.Type_Float, xp.Type_Int, xp.Type_FloatArray, etc.
+    _type: XPLMDataTypeID | int  # xp.Type_Float, xp.Type_Int, ...; written only by set_type()
     writable: bool
     size: int  # scalar=1, array=N
 
@@ -106,18 +109,29 @@ class FakeDataRef:
 
     last_modified: float = field(default_factory=time.monotonic)
 
-    # ============================================================
-    # Derived properties
-    # ============================================================
+    # -------------------------
+    # True for array-typed refs (including 1-element arrays). Scalar vs
+    # array is determined by dtype, NOT by size. Derived from type, and
+    # kept in step by set_type() so hot paths read a plain slot.
+    # -------------------------
+    is_array: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.is_array = bool(self._type & _ARRAY_TYPE_MASK)
 
     @property
-    def is_array(self) -> bool:
-        """
-        True for array-typed refs (including 1-element arrays).
+    def type(self) -> XPLMDataTypeID | int:
+        """The dtype. Read-only: set_type() keeps is_array in step with it."""
+        return self._type
 
-        Scalar vs array is determined by dtype, NOT by size.
-        """
-        return bool(self.type & (Type_FloatArray | Type_IntArray | Type_Data))
+    def set_type(self, dtype: XPLMDataTypeID | int) -> None:
+        """Change the dtype and refresh the derived is_array flag."""
+        self._type = dtype
+        self.is_array = bool(dtype & _ARRAY_TYPE_MASK)
+
+    # ============================================================
+    # Derived properties
+    # ============================================================
 
     @property
     def dynamic_array(self) -> bool:
@@ -525,8 +539,11 @@ class WidgetInfo:
         self._callbacks.append(cb)
 
     def remove_callback(self, cb: XPWidgetCallback) -> None:
-        if cb in self._callbacks:
+        # One scan: list.remove() already searches, so don't probe with `in` first
+        try:
             self._callbacks.remove(cb)
+        except ValueError:
+            pass
 
     # ------------------------------------------------------------
     # HIERARCHY
@@ -540,9 +557,11 @@ class WidgetInfo:
         self.window._dirty_widgets = True
 
     def remove_child(self, child_id: XPWidgetID) -> None:
-        if child_id in self._children:
+        try:
             self._children.remove(child_id)
-            self.window._dirty_widgets = True
+        except ValueError:
+            return
+        self.window._dirty_widgets = True
 
 
 @dataclass(slots=True)
@@ -707,8 +726,11 @@ class WindowExInfo:
 
     def remove_from_widget_z_order(self, wid: XPWidgetID) -> None:
         """Remove a widget from the z-order and clear focus if needed."""
-        if wid in self._z_order:
+        try:
             self._z_order.remove(wid)
+        except ValueError:
+            pass
+        else:
             self._dirty_widgets = True
 
         if self._focused_widget == wid:
@@ -716,17 +738,21 @@ class WindowExInfo:
 
     def raise_widget(self, wid: XPWidgetID) -> None:
         """Bring a widget to the front of the z-order."""
-        if wid in self._z_order:
+        try:
             self._z_order.remove(wid)
-            self._z_order.append(wid)
-            self._dirty_widgets = True
+        except ValueError:
+            return
+        self._z_order.append(wid)
+        self._dirty_widgets = True
 
     def lower_widget(self, wid: XPWidgetID) -> None:
         """Send a widget to the back of the z-order."""
-        if wid in self._z_order:
+        try:
             self._z_order.remove(wid)
-            self._z_order.insert(0, wid)
-            self._dirty_widgets = True
+        except ValueError:
+            return
+        self._z_order.insert(0, wid)
+        self._dirty_widgets = True
 
     # ------------------------------------------------------------
     # WIDGET FOCUS HELPERS
@@ -895,7 +921,7 @@ class MenuRecord:
     items: List[MenuItemRecord] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuItemRecord:
     name: str
     dpg_tag: str
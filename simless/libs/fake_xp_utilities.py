@@ -14,6 +14,9 @@ from simless.libs.fake_xp_types import CommandCallback, CommandHandlerRecord
 if TYPE_CHECKING:
     from simless.libs.fake_xp import FakeXP
 
+# Shared default for commands without handlers (avoids a new list per dispatch)
+_NO_HANDLERS: tuple[CommandHandlerRecord, ...] = ()
+
 
 class FakeXPUtilities:
     """
@@ -24,6 +27,9 @@ class FakeXPUtilities:
     _name_to_cmd: Dict[str, XPLMCommandRef]
     _cmd_to_name: Dict[XPLMCommandRef, str]
     _cmd_handlers: Dict[XPLMCommandRef, List[CommandHandlerRecord]]
+    _cmd_dispatch: Dict[XPLMCommandRef, tuple[CommandHandlerRecord, ...]]
+    _system_path: str
+    _prefs_path: str
 
     @property
     def fake_xp(self) -> FakeXP:
@@ -35,23 +41,30 @@ class FakeXPUtilities:
         self._name_to_cmd = {}
         self._cmd_to_name = {}
         self._cmd_handlers = {}
+        self._cmd_dispatch = {}
+
+        # The X-Plane root is fixed for the lifetime of FakeXP
+        self._system_path = str(self.fake_xp._xplane_root) + os.sep
+        self._prefs_path = os.path.join(self.fake_xp._xplane_root, "Output", "preferences")
 
     # ------------------------------------------------------------------
     # SPEAK
     # ------------------------------------------------------------------
-    def speakString(self, text: str) -> None:
+    @staticmethod
+    def speakString(text: str) -> None:
         print(f"[FakeXP speak] {text}")
 
     # ------------------------------------------------------------------
     # PATHS
     # ------------------------------------------------------------------
     def getSystemPath(self) -> str:
-        return str(self.fake_xp._xplane_root) + os.sep
+        return self._system_path
 
     def getPrefsPath(self) -> str:
-        return os.path.join(self.fake_xp._xplane_root, "Output", "preferences")
+        return self._prefs_path
 
-    def getDirectorySeparator(self) -> str:
+    @staticmethod
+    def getDirectorySeparator() -> str:
         return os.sep
 
     # ------------------------------------------------------------------
@@ -65,8 +78,9 @@ class FakeXPUtilities:
         Create or return an XPLMCommandRef for the given name.
         Does NOT attach behavior; you must register handlers separately.
         """
-        if name in self._name_to_cmd:
-            return self._name_to_cmd[name]
+        existing = self._name_to_cmd.get(name)
+        if existing is not None:
+            return existing
 
         cmd = XPLMCommandRef(self._next_command_idx)
         self._next_command_idx += 1
@@ -96,9 +110,6 @@ class FakeXPUtilities:
         """
         xp.registerCommandHandler(commandRef, callback, before=1, refCon=None)
         """
-        if commandRef not in self._cmd_handlers:
-            self._cmd_handlers[commandRef] = []
-
         # XP allows same callback both before and after; we model flags explicitly
         rec = CommandHandlerRecord(
             callback=callback,
@@ -106,7 +117,8 @@ class FakeXPUtilities:
             before=bool(before),
             after=not bool(before),
         )
-        self._cmd_handlers[commandRef].append(rec)
+        self._cmd_handlers.setdefault(commandRef, []).append(rec)
+        self._rebuild_cmd_dispatch(commandRef)
 
     def unregisterCommandHandler(
             self,
@@ -135,29 +147,31 @@ class FakeXPUtilities:
                     h.after == after_flag
             )
         ]
+        self._rebuild_cmd_dispatch(commandRef)
 
     # -------- phase dispatch ------------------------------------------
 
+    def _rebuild_cmd_dispatch(self, commandRef: XPLMCommandRef) -> None:
+        """
+        Snapshot a command's handlers in dispatch order: BEFORE, NORMAL
+        (neither before nor after), then AFTER, each in registration order.
+        """
+        handlers = self._cmd_handlers.get(commandRef)
+        if not handlers:
+            self._cmd_dispatch.pop(commandRef, None)
+            return
+
+        self._cmd_dispatch[commandRef] = (
+            tuple(h for h in handlers if h.before)
+            + tuple(h for h in handlers if not h.before and not h.after)
+            + tuple(h for h in handlers if h.after)
+        )
+
     def _dispatch_phase(self, commandRef: XPLMCommandRef, phase: XPLMCommandPhase) -> None:
-        handlers = self._cmd_handlers.get(commandRef, [])
-
-        # BEFORE handlers
-        for h in handlers:
-            if h.before:
-                if h.callback(commandRef, phase, h.refcon) == 0:
-                    return  # stop further processing
-
-        # NORMAL handlers (neither before nor after)
-        for h in handlers:
-            if not h.before and not h.after:
-                if h.callback(commandRef, phase, h.refcon) == 0:
-                    return  # stop further processing
-
-        # AFTER handlers
-        for h in handlers:
-            if h.after:
-                if h.callback(commandRef, phase, h.refcon) == 0:
-                    return  # stop further processing
+        # The snapshot is immutable, so handlers may (un)register mid-dispatch
+        for h in self._cmd_dispatch.get(commandRef, _NO_HANDLERS):
+            if h.callback(commandRef, phase, h.refcon) == 0:
+                return  # stop further processing
 
         # If no handler returned 0, XP internal behavior would run here
         # (FakeXP can optionally simulate built-in commands)
@@ -61,14 +61,12 @@ if TYPE_CHECKING:
 
 
 class FakeXPWidget:
+    widget_manager: WidgetManager
+
     @property
     def fake_xp(self) -> FakeXP:
         return cast("FakeXP", cast(object, self))
 
-    @property
-    def wm(self) -> WidgetManager:
-        return self.fake_xp.widget_manager
-
     def createWidget(
             self,
             left: int,
@@ -116,11 +114,11 @@ class FakeXPWidget:
                 raise ValueError("MainWindow widget cannot be a child widget")
 
         parent_wid = XPWidgetID(container)
-        parent_info = self.wm.require_info(parent_wid)
+        parent_info = self.widget_manager.require_info(parent_wid)
         window_info = parent_info.window
 
         # geometry=abs_geom → WidgetInfo converts to local internally
-        info = self.wm.create_widget(
+        info = self.widget_manager.create_widget(
             widget_class=widgetClass,
             window=window_info,
             abs_geom=abs_geom,
@@ -155,7 +153,7 @@ class FakeXPWidget:
         # ---------------------------------------------------------
         # Root widget uses the CLIENT RECT as its ABSOLUTE geometry.
         # WidgetInfo will convert this to local_xpgeom = (0,0,w,h)
-        root_info = self.wm.create_widget(
+        root_info = self.widget_manager.create_widget(
             widget_class=widgetClass,
             window=win_info,
             abs_geom=win_info.frame,
@@ -178,7 +176,7 @@ class FakeXPWidget:
             bottom=win_info.frame.top - title_h - 4,
         )
 
-        self.wm.create_widget(
+        self.widget_manager.create_widget(
             widget_class=self.fake_xp.WidgetClass_Caption,
             window=win_info,
             abs_geom=title_geom,
@@ -197,7 +195,7 @@ class FakeXPWidget:
             right=win_info.frame.right,
             bottom=win_info.frame.top - close_size - 4,
         )
-        close_info = self.wm.create_widget(
+        close_info = self.widget_manager.create_widget(
             widget_class=self.fake_xp.WidgetClass_Button,
             window=win_info,
             abs_geom=close_geom,
@@ -218,7 +216,7 @@ class FakeXPWidget:
         parent unlinking, z-order removal, focus clearing, backend deletion queueing,
         and XP→DPG dirtying.
         """
-        self.wm.destroy_widget(wid)
+        self.widget_manager.destroy_widget(wid)
 
     # ------------------------------------------------------------------
     # GEOMETRY
@@ -235,21 +233,19 @@ class FakeXPWidget:
         XPWidgets API: set widget geometry in global XP coordinates.
         Geometry is stored as WGeom; WindowExInfo handles dirtying.
         """
-        info = self.wm.require_info(wid)
+        info = self.widget_manager.require_info(wid)
         info.set_abs_xpgeom(XPGeom(left, top, right, bottom))
 
     def getWidgetGeometry(self, wid: XPWidgetID) -> tuple[int, int, int, int]:
         """
         XPWidgets API: return authoritative XP geometry.
         """
-        geom = self.wm.require_info(wid).xp_geom
+        geom = self.widget_manager.require_info(wid).xp_geom
         return geom.left, geom.top, geom.right, geom.bottom
 
-    def getWidgetExposedGeometry(self, wid: XPWidgetID) -> tuple[int, int, int, int]:
-        """
-        XPWidgets API: exposed geometry is identical to stored geometry.
-        """
-        return self.getWidgetGeometry(wid)
+    # XPWidgets API: exposed geometry is identical to stored geometry, so
+    # getWidgetExposedGeometry is getWidgetGeometry (no forwarding frame).
+    getWidgetExposedGeometry = getWidgetGeometry
 
     # ------------------------------------------------------------------
     # VISIBILITY
@@ -258,21 +254,21 @@ class FakeXPWidget:
         """
         XPWidgets API: show widget.
         """
-        info = self.wm.require_info(wid)
+        info = self.widget_manager.require_info(wid)
         info.set_visible(True)
 
     def hideWidget(self, wid: XPWidgetID) -> None:
         """
         XPWidgets API: hide widget.
         """
-        info = self.wm.require_info(wid)
+        info = self.widget_manager.require_info(wid)
         info.set_visible(False)
 
     def isWidgetVisible(self, wid: XPWidgetID) -> bool:
         """
         XPWidgets API: return visibility state.
         """
-        return bool(self.wm.require_info(wid).visible)
+        return bool(self.widget_manager.require_info(wid).visible)
 
     # ------------------------------------------------------------------
     # PROPERTIES
@@ -286,7 +282,7 @@ class FakeXPWidget:
         """
         XPWidgets API: set a widget property.
         """
-        info = self.wm.require_info(wid)
+        info = self.widget_manager.require_info(wid)
         info.properties[prop] = value
 
         info.window._dirty_xp_to_dpg = True
@@ -297,13 +293,13 @@ class FakeXPWidget:
         """
         XPWidgets API: get a widget property.
         """
-        return self.wm.require_info(widgetID).properties.get(propertyID)
+        return self.widget_manager.require_info(widgetID).properties.get(propertyID)
 
     # ------------------------------------------------------------------
     # CALLBACKS + MESSAGE DISPATCH
     # ------------------------------------------------------------------
     def addWidgetCallback(self, wid: XPWidgetID, callback: XPWidgetCallback) -> None:
-        info = self.wm.require_info(wid)
+        info = self.widget_manager.require_info(wid)
         if callback not in info.callbacks:
             info.callbacks.append(callback)
 
@@ -318,7 +314,7 @@ class FakeXPWidget:
         XPWidgets API: send a message to a widget.
         Dispatching is handled entirely by the widget manager.
         """
-        self.wm.queue_msg(wid, msg, param1, param2)
+        self.widget_manager.queue_msg(wid, msg, param1, param2)
 
     def broadcastMessageToWidget(
             self,
@@ -340,10 +336,10 @@ class FakeXPWidget:
             visited.add(current)
 
             # Dispatch to this widget
-            self.wm.queue_msg(current, msg, param1, param2)
+            self.widget_manager.queue_msg(current, msg, param1, param2)
 
             # Recurse into children
-            info = self.wm.require_info(current)
+            info = self.widget_manager.require_info(current)
             for child in info.children:
                 _broadcast(child)
 
@@ -356,7 +352,7 @@ class FakeXPWidget:
         """
         XPWidgets API: return the parent widget ID, or None if root.
         """
-        return self.wm.require_info(wid).parent
+        return self.widget_manager.require_info(wid).parent
 
     def getWidgetForLocation(
             self,
@@ -371,7 +367,7 @@ class FakeXPWidget:
         """
 
         xp_pt = XPPoint(x, y)
-        return self.wm.hit_test(wid, xp_pt, bool(recursive))
+        return self.widget_manager.hit_test(wid, xp_pt, bool(recursive))
 
     # ------------------------------------------------------------------
     # Z‑ORDER
@@ -380,7 +376,7 @@ class FakeXPWidget:
         """
         XPWidgets API: return True if the widget is the frontmost in its window.
         """
-        info = self.wm.require_info(wid)
+        info = self.widget_manager.require_info(wid)
         z = info.window.widget_z_order
         return bool(z) and z[-1] == wid
 
@@ -388,13 +384,13 @@ class FakeXPWidget:
         """
         XPWidgets API: raise widget to front within its window.
         """
-        self.wm.raise_widget(wid)
+        self.widget_manager.raise_widget(wid)
 
     def pushWidgetBehind(self, wid: XPWidgetID) -> None:
         """
         XPWidgets API: send widget to back within its window.
         """
-        self.wm.lower_widget(wid)
+        self.widget_manager.lower_widget(wid)
 
     # ------------------------------------------------------------------
     # KEYBOARD FOCUS
@@ -415,13 +411,13 @@ class FakeXPWidget:
         """
         XPWidgets API: give keyboard focus to a widget.
         """
-        self.wm.set_focus(wid)
+        self.widget_manager.set_focus(wid)
 
     def loseKeyboardFocus(self, wid: XPWidgetID) -> None:
         """
         XPWidgets API: remove keyboard focus from a widget if it currently has it.
         """
-        self.wm.clear_focus(wid)
+        self.widget_manager.clear_focus(wid)
 
     # ------------------------------------------------------------------
     # DESCRIPTOR / CLASS
@@ -430,24 +426,24 @@ class FakeXPWidget:
         """
         XPWidgets API: get the widget's descriptor string.
         """
-        return self.wm.require_info(wid).descriptor
+        return self.widget_manager.require_info(wid).descriptor
 
     def setWidgetDescriptor(self, wid: XPWidgetID, text: str) -> None:
         """
         XPWidgets API: set the widget's descriptor string.
         """
-        info = self.wm.require_info(wid)
+        info = self.widget_manager.require_info(wid)
         info.set_descriptor(text)
 
     def getWidgetClass(self, wid: XPWidgetID) -> XPWidgetClass:
         """
         XPWidgets API: get the widget's class.
         """
-        return self.wm.require_info(wid).widget_class
+        return self.widget_manager.require_info(wid).widget_class
 
     def getWidgetUnderlyingWindow(self, wid: XPWidgetID) -> int:
         """
         XPWidgets API: return the underlying XPLM window ID for this widget's window.
         """
-        info = self.wm.require_info(wid)
+        info = self.widget_manager.require_info(wid)
         return int(info.window.wid)
@@ -5,7 +5,7 @@ from typing import Any, Callable, Optional
 
 from xp_typing import XPLMPluginID
 
-@dataclass
+@dataclass(slots=True)
 class FlightLoop:
     """
     XP12‑style flightloop scheduling capsule.
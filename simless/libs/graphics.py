@@ -68,6 +68,10 @@ class GraphicsManager(GraphicsDpg):
         ]
     ]
 
+    # Same entries in dispatch order (phase ascending, before-pass first),
+    # rebuilt on (un)register so draw_frame() does no per-frame sorting.
+    _draw_dispatch: tuple[tuple[Callable[[int, int], Any], int, int], ...]
+
     # ------------------------------------------------------------------
     # Texture bookkeeping (simless stub)
     #
@@ -117,6 +121,7 @@ class GraphicsManager(GraphicsDpg):
 
         # Screen-level draw callbacks
         self._draw_callbacks = []
+        self._draw_dispatch = ()
 
         # Texture bookkeeping
         self._next_tex_id = 1
@@ -145,6 +150,7 @@ class GraphicsManager(GraphicsDpg):
     ) -> None:
         """Public API: register a draw callback."""
         self._draw_callbacks.append((cb, phase, wants_before))
+        self._rebuild_draw_dispatch()
 
     def unregister_draw_callback(
             self,
@@ -158,6 +164,15 @@ class GraphicsManager(GraphicsDpg):
             for entry in self._draw_callbacks
             if not (entry[0] is cb and entry[1] == phase and entry[2] == wants_before)
         ]
+        self._rebuild_draw_dispatch()
+
+    def _rebuild_draw_dispatch(self) -> None:
+        # Only wants_before 1/0 are ever dispatched; sorted() is stable so
+        # registration order is kept within each (phase, wants_before) pass.
+        self._draw_dispatch = tuple(sorted(
+            (entry for entry in self._draw_callbacks if entry[2] in (0, 1)),
+            key=lambda entry: (entry[1], -entry[2]),
+        ))
 
     def get_screen_drawlists(self) -> tuple[str | int, str | int]:
         """Return (back_drawlist, front_drawlist)."""
@@ -253,12 +268,8 @@ class GraphicsManager(GraphicsDpg):
 
         # 3) XP screen-level drawing (enqueue only)
         self._active_drawlist = self._screen_drawlist_back
-        phases = sorted({phase for _, phase, _ in self._draw_callbacks})
-        for phase in phases:
-            for wants_before in (1, 0):
-                for cb, cb_phase, cb_wants_before in list(self._draw_callbacks):
-                    if cb_phase == phase and cb_wants_before == wants_before:
-                        cb(phase, wants_before)
+        for cb, phase, wants_before in self._draw_dispatch:
+            cb(phase, wants_before)
 
         # 4) Execute deferred DPG commands (screen-level)
         for cmd in self._dpg_commands:
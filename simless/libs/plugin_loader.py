@@ -5,15 +5,23 @@ import inspect
 import os
 import sys
 import types
+from functools import lru_cache
 from types import ModuleType
-from typing import List, Protocol, TYPE_CHECKING
+from typing import Dict, List, Protocol, TYPE_CHECKING, Tuple
 
+from simless.libs.fake_xp_constants import XP_CONSTANTS
 from xp_typing import XPLMPluginID
 
 if TYPE_CHECKING:
     from simless.libs.fake_xp import FakeXP
 
 
+@lru_cache(maxsize=None)
+def _public_api_names(cls: type) -> Tuple[str, ...]:
+    """Public, non-constant attribute names of a FakeXP class (fixed per class)."""
+    return tuple(n for n in dir(cls) if not n.startswith("_") and n not in XP_CONSTANTS)
+
+
 # ---------------------------------------------------------------------------
 # Plugin interface protocol (X‑Plane authentic)
 # ---------------------------------------------------------------------------
@@ -34,7 +42,22 @@ class PythonInterfaceProto(Protocol):
 # LoadedPlugin container
 # ---------------------------------------------------------------------------
 
+def _no_receive(sender: int, msg: int, param) -> None:
+    """Stand-in receiver for plugins without XPluginReceiveMessage."""
+
+
 class LoadedPlugin:
+    __slots__ = (
+        "plugin_id",
+        "name",
+        "signature",
+        "description",
+        "module",
+        "instance",
+        "enabled",
+        "_recv",
+    )
+
     def __init__(
             self,
             plugin_id: XPLMPluginID,
@@ -52,15 +75,16 @@ class LoadedPlugin:
         self.instance = instance
         self.enabled = False
 
-        # Bind optional receive method
-        self._recv = getattr(instance, "XPluginReceiveMessage", None)
+        # Bind optional receive method once; a no-op stands in when absent so
+        # receive_message() never has to test for it
+        recv = getattr(instance, "XPluginReceiveMessage", None)
+        self._recv = recv if callable(recv) else _no_receive
 
     def has_receive(self) -> bool:
-        return callable(self._recv)
+        return self._recv is not _no_receive
 
     def receive_message(self, sender: int, msg: int, param) -> None:
-        if self._recv:
-            self._recv(sender, msg, param)
+        self._recv(sender, msg, param)
 
     def __repr__(self) -> str:
         return f"<LoadedPlugin id={self.plugin_id} name={self.name}>"
@@ -86,6 +110,8 @@ class SimlessPluginLoader:
         os.chdir(self.xp._xplane_root)
 
         self._loaded_plugins: List[LoadedPlugin] = []
+        self._plugins_by_id: Dict[XPLMPluginID, LoadedPlugin] = {}
+        self._ids_by_signature: Dict[str, XPLMPluginID] = {}
         self._next_id: int = 1
 
         self._ensure_sys_path()
@@ -141,10 +167,19 @@ class SimlessPluginLoader:
         xp_mod.VERSION = "FakeXP"
         xp_mod.log = self.xp.log
 
-        # Expose FakeXP API surface
-        for name in dir(self.xp):
-            if not name.startswith("_"):
-                setattr(xp_mod, name, getattr(self.xp, name))
+        # Constants are the bulk of the surface and identical for every
+        # FakeXP, so copy them straight from the prebuilt table.
+        xp_mod.__dict__.update(XP_CONSTANTS)
+
+        # Expose the rest of the FakeXP API surface: class-level names are
+        # computed once per class, then instance attributes (managers, flags)
+        # are added on top.
+        fake = self.xp
+        for name in _public_api_names(type(fake)):
+            setattr(xp_mod, name, getattr(fake, name))
+        for name in vars(fake):
+            if not name.startswith("_") and name not in XP_CONSTANTS:
+                setattr(xp_mod, name, getattr(fake, name))
 
         sys.modules["xp"] = xp_mod
         self.xp.log("[Loader] Installed xp façade module")
@@ -162,10 +197,10 @@ class SimlessPluginLoader:
     # ----------------------------------------------------------------------
 
     def get_plugin(self, plugin_id: XPLMPluginID) -> LoadedPlugin | None:
-        return next((p for p in self.loaded_plugins if p.plugin_id == plugin_id), None)
+        return self._plugins_by_id.get(plugin_id)
 
     def find_plugin_by_signature(self, signature: str) -> XPLMPluginID:
-        return next((p.plugin_id for p in self.loaded_plugins if p.signature == signature), XPLMPluginID(-1))
+        return self._ids_by_signature.get(signature, XPLMPluginID(-1))
 
     def find_plugin_by_path(self, path: str) -> XPLMPluginID:
         return next((p.plugin_id for p in self.loaded_plugins if getattr(p.module, "__file__", None) == path),
@@ -197,6 +232,11 @@ class SimlessPluginLoader:
             plugins.append(plugin)
 
         self._loaded_plugins = plugins
+        self._plugins_by_id = {p.plugin_id: p for p in plugins}
+        # First plugin wins on duplicate signatures, as with the old scan
+        self._ids_by_signature = {}
+        for p in plugins:
+            self._ids_by_signature.setdefault(p.signature, p.plugin_id)
 
     def _load_single(self, name: str) -> LoadedPlugin:
         self.xp.log(f"[Loader] Loading module {name}")
@@ -80,7 +80,7 @@ import os
 import time
 import traceback
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from XPPython3.xp_typing import XPLMCommandRef, XPLMMenuID, XPLMPluginID
 from simless.libs.dataref import DataRefManager
@@ -118,7 +118,6 @@ class SimlessRunner:
         # Core state
         # ------------------------------------------------------------------
         self._running: bool = False
-        self._sim_time = 0.0
 
         # ------------------------------------------------------------------
         # 1. Install synthetic XPPython3 runtime BEFORE importing plugin code
@@ -160,8 +159,7 @@ class SimlessRunner:
         # ------------------------------------------------------------------
         # 5. Flightloop state
         # ------------------------------------------------------------------
-        self._next_flightloop_id: int = 1
-        self._flightloops: Dict[int, Dict[str, Any]] = {}
+        # Flightloop records and their queues live on FakeXPFlightLoop
         self._sim_time: float = 0.0
         self._cycles: int = 0
         self._next_view_cycle: int = 0
@@ -252,36 +250,37 @@ class SimlessRunner:
         # ------------------------------------------------------------
         # 1) Advance sim time
         # ------------------------------------------------------------
-        dt = 1.0 / 60.0
-        self.sim_time += dt
-        xp._sim_time = self.sim_time
-        now = self.sim_time
+        # Plain attribute arithmetic; getElapsedTime()/getCycleNumber() read
+        # these counters back, so nothing else needs to be mirrored.
+        now = self._sim_time = self._sim_time + 1.0 / 60.0
 
         # Advance cycle counter
-        self._cycles += 1
-        cycle = self._cycles
-
-        # ------------------------------------------------------------
-        # 2) Bridge sync
-        # ------------------------------------------------------------
-        if self.bridge_client.ready_for_processing():
-            self.bridge_client.manage_bridged_datarefs()
-
-        # ------------------------------------------------------------
-        # 3) Run flightloops (under plugin context)
-        # ------------------------------------------------------------
-        for fl in xp.all_flightloop():
-            try:
-                # noinspection PyArgumentList
-                with self.plugin_context(fl.plugin_id):
-                    fl.check_and_run(now, cycle)
-            except Exception:
-                tb = traceback.format_exc()
-                plugin = self.loader.get_plugin(fl.plugin_id)
-                name = plugin.name if plugin else "<unknown plugin>"
-                xp.log(f"[FlightLoop:{name}] callback exception:\n{tb}")
-                fl.schedule(0.0, True, now, cycle)
-                continue
+        cycle = self._cycles = self._cycles + 1
+
+        # Bridge sync and flightloops write datarefs in bursts; stamp every
+        # change made in this part of the frame with one clock read.
+        with xp.dataref_manager.batch_updates():
+            # ------------------------------------------------------------
+            # 2) Bridge sync
+            # ------------------------------------------------------------
+            if self.bridge_client.ready_for_processing():
+                self.bridge_client.manage_bridged_datarefs()
+
+            # ------------------------------------------------------------
+            # 3) Run flightloops (under plugin context)
+            # ------------------------------------------------------------
+            for fid, fl in xp.pop_due_flightloops(now, cycle):
+                try:
+                    # noinspection PyArgumentList
+                    with self.plugin_context(fl.plugin_id):
+                        fl.check_and_run(now, cycle)
+                except Exception:
+                    tb = traceback.format_exc()
+                    plugin = self.loader.get_plugin(fl.plugin_id)
+                    name = plugin.name if plugin else "<unknown plugin>"
+                    xp.log(f"[FlightLoop:{name}] callback exception:\n{tb}")
+                    fl.schedule(0.0, True, now, cycle)
+                xp.requeue_flightloop(fid)
 
         # 5. Dataref viewer
         if cycle > self._next_view_cycle:
@@ -380,19 +379,22 @@ class SimlessRunner:
                 xp.log(f"[Runner] graphics/frame error: {exc!r}\n{tb}")
                 break
 
+            # One clock read per frame for run_time, pacing and broadcasts
+            frame_end = time.monotonic()
+
             # Optional timed exit
-            duration = time.monotonic() - start
+            duration = frame_end - start
             if 0 < run_time < duration:
                 xp.log("[Runner] Flight loop exit: run_time reached")
                 break
 
             # Maintain ~60 FPS
-            elapsed = time.monotonic() - frame_start
+            elapsed = frame_end - frame_start
             remaining = target_dt - elapsed
             if remaining > 0:
                 time.sleep(remaining)
 
-            if not xplane_broadcast_sent and time.monotonic() - start > 5:
+            if not xplane_broadcast_sent and duration > 5:
                 xp.log("[Runner] === Send X-Plane Broadcasts ===")
                 self.send_initial_xplane_broadcasts()
                 xplane_broadcast_sent = True
@@ -550,7 +550,7 @@ class WidgetRender:
         props = info.properties
         xp = self.mgr.fake_xp
         wclass = info.widget_class
-        behavior = info.properties.get(self.mgr.fake_xp.Property_ButtonBehavior)
+        behavior = props.get(xp.Property_ButtonBehavior)
 
         # ------------------------------------------------------------
         # FONT BINDING (only when non-default)
@@ -578,7 +578,7 @@ class WidgetRender:
         # ------------------------------------------------------------
         # CHECKBOX (XPWidget_Button + ButtonBehaviorCheckBox)
         # ------------------------------------------------------------
-        if wclass == self.mgr.fake_xp.WidgetClass_Button and \
+        if wclass == xp.WidgetClass_Button and \
                 behavior == xp.ButtonBehaviorCheckBox:
             dpg_id = info.dpg_id
             if dpg_id is None:
@@ -587,7 +587,7 @@ class WidgetRender:
             # --------------------------------------------------------
             # 1. Push XP → DPG (checked state)
             # --------------------------------------------------------
-            xp_checked = bool(info.properties.get(xp.Property_ButtonState, 0))
+            xp_checked = bool(props.get(xp.Property_ButtonState, 0))
             dpg_checked = bool(self.mgr.gm.dpg_get_value(dpg_id))
             if dpg_checked != xp_checked:
                 self.mgr.gm.enqueue_dpg(
@@ -599,13 +599,13 @@ class WidgetRender:
         # ------------------------------------------------------------
         # RADIO BOX
         # ------------------------------------------------------------
-        if wclass == self.mgr.fake_xp.WidgetClass_Button and \
+        if wclass == xp.WidgetClass_Button and \
                 behavior == xp.ButtonBehaviorRadioButton:
             dpg_id = info.dpg_id
             if dpg_id is None:
                 return
 
-            xp_checked = bool(info.properties.get(xp.Property_ButtonState, 0))
+            xp_checked = bool(props.get(xp.Property_ButtonState, 0))
             value = "***" if xp_checked else "   "
             self.mgr.gm.enqueue_dpg(
                 op=DPGOp.CONFIGURE_ITEM,
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class WindowManager:
     """Owns WindowEx registry, IDs, and Z-order."""
 
+    __slots__ = ("_windows_ex", "_next_window_id", "fake_xp")
+
     BORDER_TOP = 4
     BORDER_LEFT = 4
     BORDER_RIGHT = 4
@@ -4,6 +4,7 @@ import sys
 import types
 
 from simless.libs.fake_xp import FakeXP
+from simless.libs.fake_xp_constants import XP_CONSTANTS
 
 
 def wire_xppython3_runtime(fake_xp: FakeXP) -> None:
@@ -32,6 +33,12 @@ def wire_xppython3_runtime(fake_xp: FakeXP) -> None:
     xp_mod = types.ModuleType("xp")
     xp_mod.VERSION = getattr(fake_xp, "VERSION", "FakeXP")
 
+    # Constants never change, so they live in the module dict and never reach
+    # the hook below. Everything else, API methods included, forwards live so
+    # instance-level rebinding (debug_logging swapping dbg, monkeypatching)
+    # is always seen.
+    xp_mod.__dict__.update(XP_CONSTANTS)
+
     # ⭐ Forward attribute access to FakeXP
     def __getattr__(name: str):
         return getattr(fake_xp, name)
@@ -89,20 +89,18 @@ def inline_plugin():
 @pytest.fixture
 def update_dataref():
     def _update(ref, *, dtype: int, size=None, value=None):
-        if not ref.is_dummy:
+        if not ref.dummy:
             raise RuntimeError("update_dataref only valid for dummy refs")
 
         if size is not None and size <= 0:
             raise ValueError("size must be > 0")
 
+        # set_type() keeps is_array in step; it follows dtype, not size
         if dtype is not None:
-            ref.type = dtype
-            ref.type_known = True
+            ref.set_type(dtype)
 
         if size is not None:
             ref.size = size
-            ref.is_array = size > 1
-            ref.shape_known = True
 
         if value is not None:
             ref.value = value
@@ -1,6 +1,8 @@
 # tests/test_fake_xp_dataref.py
 
 from typing import List
+import time
+
 import pytest
 
 import XPPython3
@@ -31,6 +33,21 @@ def test_find_and_dummy_creation(xp: FakeXP):
     assert ref.value == 0.0
 
 
+def test_dataref_type_changes_only_through_set_type(xp: FakeXP):
+    dr = xp.findDataRef("sim/test/set_type")
+    ref = xp.dataref_manager.require_handle(dr)
+
+    with pytest.raises(AttributeError):
+        ref.type = xp.Type_FloatArray
+
+    ref.set_type(xp.Type_FloatArray)
+    assert ref.type == xp.Type_FloatArray
+    assert ref.is_array is True
+
+    ref.set_type(xp.Type_Int)
+    assert ref.is_array is False
+
+
 def test_dummy_scalar_recasts_then_expands_but_stays_dummy(xp: FakeXP):
     dr = xp.findDataRef("sim/test/dummy_scalar_to_array")
     ref = xp.dataref_manager.require_handle(dr)
@@ -68,6 +85,17 @@ def test_get_dataref_types_and_info(xp: FakeXP):
     assert info.size == 0
 
 
+def test_get_dataref_info_returns_independent_objects(xp: FakeXP):
+    dr = xp.findDataRef("sim/test/info_copy")
+
+    first = xp.getDataRefInfo(dr)
+    first.size = 99
+
+    second = xp.getDataRefInfo(dr)
+    assert second is not first
+    assert second.size == 0
+
+
 # ================================================================
 #  CAN WRITE + IS GOOD + PROMOTION
 # ================================================================
@@ -195,8 +223,26 @@ def test_setDatab_internal_buffer_and_real_bounds(xp: FakeXP):
         xp.setDatab(dr, [ord("X"), ord("Y"), ord("Z"), ord("!"), ord("?")], 0, 5)
 
 
+def test_setDatab_list_validation_and_masking(xp: FakeXP):
+    dr = xp.findDataRef("sim/test/bytes_validate")
+    ref = xp.dataref_manager.require_handle(dr)
+
+    xp.dataref_manager.promote(ref, xp.Type_Data, writable=True, array_size=4)
+
+    # Ints outside 0..255 are masked to a byte
+    xp.setDatab(dr, [0x141, -1], 0, 2)
+    assert bytes(ref.value[:2]) == b"A\xff"
+
+    # Any non-int element is rejected, even past count
+    with pytest.raises(ValueError):
+        xp.setDatab(dr, [65, 66, 1.5], 0, 2)
+    with pytest.raises(ValueError):
+        xp.setDatab(dr, [65, "B"], 0, 2)
+    assert bytes(ref.value[:2]) == b"A\xff"
+
+
 def test_transform_scalar_array_semantics(xp: FakeXP):
-    dm = xp.dm
+    dm = xp.dataref_manager
 
     # ------------------------------------------------------------
     # FLOAT ARRAY
@@ -458,3 +504,128 @@ def test_accessor_precedence_over_internal_storage(xp: FakeXP):
     out2 = [0.0] * 4
     xp.getDatavf(dr, out2, 0, 4)
     assert out2 == internal
+
+
+# ================================================================
+#  STALE HANDLES
+# ================================================================
+
+def test_is_dataref_good_rejects_stale_and_bogus_handles(xp: FakeXP):
+    dr = xp.findDataRef("sim/test/stale")
+    xp.dataref_manager.del_handle(dr)
+
+    # Probes answer False without raising
+    assert xp.isDataRefGood(dr) is False
+    assert xp.isDataRefGood(9999) is False
+    assert xp.isDataRefGood(-1) is False
+
+
+# ================================================================
+#  BATCHED CHANGE STAMPS
+# ================================================================
+
+def test_batch_updates_share_one_stamp(xp: FakeXP):
+    dm = xp.dataref_manager
+
+    refs = []
+    for path in ("sim/test/batch_a", "sim/test/batch_b"):
+        dr = xp.findDataRef(path)
+        ref = dm.require_handle(dr)
+        dm.promote(ref, xp.Type_Float, writable=True, array_size=1)
+        refs.append((dr, ref))
+    (dr_a, ref_a), (dr_b, ref_b) = refs
+
+    with dm.batch_updates():
+        xp.setDataf(dr_a, 1.0)
+        with dm.batch_updates():  # nested blocks reuse the outer stamp
+            xp.setDataf(dr_b, 2.0)
+        stamp = ref_a.last_modified
+
+    assert ref_b.last_modified == stamp
+    assert dm.last_updated == stamp
+
+    # Outside the block writes read the clock again
+    time.sleep(0.001)
+    xp.setDataf(dr_a, 3.0)
+    assert ref_a.last_modified > stamp
+
+
+# ================================================================
+#  FIND MEMO
+# ================================================================
+
+def test_find_memo_dropped_after_del_handle(xp: FakeXP):
+    path = "sim/test/memo"
+    dr = xp.findDataRef(path)
+    assert xp.findDataRef(path) == dr  # served from the memo
+
+    xp.dataref_manager.del_handle(dr)
+
+    # The memo must not hand back the deleted handle
+    dr2 = xp.findDataRef(path)
+    assert dr2 != dr
+    assert xp.isDataRefGood(dr2) is True
+    assert xp.dataref_manager.require_handle(dr2).path == path
+
+
+# ================================================================
+#  SCALAR WRITE FAST PATH
+# ================================================================
+
+def test_scalar_fast_path_casts_and_stamps(xp: FakeXP):
+    dm = xp.dataref_manager
+
+    dr_f = xp.findDataRef("sim/test/fast_float")
+    ref_f = dm.require_handle(dr_f)
+    dm.promote(ref_f, xp.Type_Float, writable=True, array_size=1)
+
+    dr_i = xp.findDataRef("sim/test/fast_int")
+    ref_i = dm.require_handle(dr_i)
+    dm.promote(ref_i, xp.Type_Int, writable=True, array_size=1)
+
+    before = dm.last_updated
+    xp.setDataf(dr_f, 3)
+    assert ref_f.value == 3.0
+    assert isinstance(ref_f.value, float)
+    assert ref_f.last_modified >= before
+    assert dm.last_updated == ref_f.last_modified
+
+    xp.setDatai(dr_i, True)
+    assert ref_i.value == 1
+    assert type(ref_i.value) is int
+
+    # A promoted ref keeps its type: mismatched setters still raise
+    with pytest.raises(TypeError):
+        xp.setDatai(dr_f, 1)
+    with pytest.raises(ValueError):
+        xp.setDataf(dr_f, "1.0")
+
+
+# ================================================================
+#  CANONICAL NUMERIC ARRAY WRITE EDGES
+# ================================================================
+
+def test_setDatavf_negative_offset_indexes_from_end(xp: FakeXP):
+    dr = xp.findDataRef("sim/test/negative_offset")
+    ref = xp.dataref_manager.require_handle(dr)
+
+    xp.dataref_manager.promote(ref, xp.Type_FloatArray, writable=True, array_size=5)
+    xp.setDatavf(dr, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    assert xp.setDatavf(dr, [9.0, 8.0], -2, 2) == 2
+
+    # Written relative to the end; storage keeps its declared size
+    assert ref.size == 5
+    assert ref.value == [1.0, 2.0, 3.0, 9.0, 8.0]
+
+
+def test_setDatavf_short_source_raises_index_error(xp: FakeXP):
+    dr = xp.findDataRef("sim/test/short_source")
+    ref = xp.dataref_manager.require_handle(dr)
+
+    xp.dataref_manager.promote(ref, xp.Type_FloatArray, writable=True, array_size=3)
+
+    with pytest.raises(IndexError):
+        xp.setDatavf(dr, [1.0], 0, 3)
+
+    assert len(ref.value) == 3
@@ -0,0 +1,88 @@
+# tests/test_fake_xp_flightloop.py
+
+import pytest
+
+import XPPython3
+from simless.libs.fake_xp import FakeXP
+
+
+@pytest.fixture
+def xp() -> FakeXP:
+    fake = FakeXP(debug_logging=True)
+    XPPython3.xp = fake
+    return fake
+
+
+def _noop(since, elapsed, counter, refcon):
+    return 0.0
+
+
+# ================================================================
+#  DEADLINE QUEUE
+# ================================================================
+
+def test_pop_due_returns_only_due_loops_in_creation_order(xp: FakeXP):
+    late = xp.createFlightLoop(_noop)
+    early = xp.createFlightLoop(_noop)
+    idle = xp.createFlightLoop(_noop)  # never scheduled
+
+    xp.scheduleFlightLoop(late, 2.0)
+    xp.scheduleFlightLoop(early, 1.0)
+
+    assert xp.pop_due_flightloops(0.5, 1) == []
+
+    due = xp.pop_due_flightloops(1.0, 2)
+    assert [fid for fid, _ in due] == [early]
+
+    due = xp.pop_due_flightloops(5.0, 3)
+    assert [fid for fid, _ in due] == [late]
+
+    assert idle not in [fid for fid, _ in xp.pop_due_flightloops(10.0, 4)]
+
+
+def test_popped_loop_runs_again_only_after_requeue(xp: FakeXP):
+    fid = xp.createFlightLoop(_noop)
+    xp.scheduleFlightLoop(fid, 1.0)
+
+    (popped, fl), = xp.pop_due_flightloops(1.0, 1)
+    assert popped == fid
+
+    # Popped entries are consumed until the runner hands the fid back
+    assert xp.pop_due_flightloops(3.0, 2) == []
+
+    fl.schedule(1.0, True, 1.0, 1)
+    xp.requeue_flightloop(fid)
+
+    assert xp.pop_due_flightloops(1.5, 2) == []
+    assert [f for f, _ in xp.pop_due_flightloops(2.0, 3)] == [fid]
+
+
+def test_rescheduled_loop_drops_stale_deadline(xp: FakeXP):
+    fid = xp.createFlightLoop(_noop)
+    xp.scheduleFlightLoop(fid, 1.0)
+    xp.scheduleFlightLoop(fid, 5.0)
+
+    # The 1.0 entry no longer matches the struct and is discarded
+    assert xp.pop_due_flightloops(1.0, 1) == []
+    assert [f for f, _ in xp.pop_due_flightloops(5.0, 2)] == [fid]
+    assert xp.pop_due_flightloops(10.0, 3) == []
+
+
+def test_cycle_scheduled_loop_is_due_by_cycle(xp: FakeXP):
+    fid = xp.createFlightLoop(_noop)
+    xp.scheduleFlightLoop(fid, -2)  # two cycles from now (cycle 0)
+
+    assert xp.pop_due_flightloops(100.0, 1) == []
+    assert [f for f, _ in xp.pop_due_flightloops(100.0, 2)] == [fid]
+
+
+def test_destroyed_loop_is_never_due(xp: FakeXP):
+    fid = xp.createFlightLoop(_noop)
+    xp.scheduleFlightLoop(fid, 1.0)
+    xp.destroyFlightLoop(fid)
+
+    assert xp.pop_due_flightloops(2.0, 1) == []
+
+    # Requeueing a destroyed loop is a no-op
+    xp.requeue_flightloop(fid)
+    assert xp.pop_due_flightloops(3.0, 2) == []
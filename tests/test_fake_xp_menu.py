@@ -0,0 +1,41 @@
+# tests/test_fake_xp_menu.py
+
+import pytest
+
+import XPPython3
+from simless.libs.fake_xp import FakeXP
+
+
+@pytest.fixture
+def xp() -> FakeXP:
+    fake = FakeXP(debug_logging=True)
+    XPPython3.xp = fake
+    return fake
+
+
+# ================================================================
+#  REMOVE MENU ITEM
+# ================================================================
+
+def test_remove_menu_item_drops_its_submenu(xp: FakeXP):
+    root = xp.menu_manager.root_menu
+
+    menu_id = xp.createMenu("Parent")
+    idx = len(root.items) - 1
+    assert root.items[idx].submenu_id == menu_id
+
+    xp.removeMenuItem(None, idx)
+
+    assert xp.menu_manager.get_menu(menu_id) is None
+    assert all(item.submenu_id != menu_id for item in root.items)
+
+
+def test_remove_plain_menu_item(xp: FakeXP):
+    menu_id = xp.createMenu("Parent")
+    xp.appendMenuItem(menu_id, "A")
+    xp.appendMenuItem(menu_id, "B")
+
+    xp.removeMenuItem(menu_id, 0)
+
+    items = xp.menu_manager.get_menu(menu_id).items
+    assert [item.name for item in items] == ["B"]